@@ -0,0 +1,24 @@
+"""Benchmarks for effect frame generation; each frame should take well under 1 ms.
+
+    pytest benchmarks/bench_effects.py
+"""
+from __future__ import annotations
+
+import pytest
+
+from custom_components.ikea_obegraensad.effects import EFFECTS
+
+SOURCE_VALUES = {
+    "plasma": [850.0],
+    "life": [0.0],
+    "heatmap": [21.5, 19.0, 23.2, 20.1, 22.8, 18.4],
+}
+
+
+@pytest.mark.parametrize("effect_id", list(EFFECTS))
+def test_render(benchmark, effect_id):
+    """Render one effect frame."""
+    effect = EFFECTS[effect_id]()
+    values = SOURCE_VALUES[effect_id]
+    frame = benchmark(effect.render, 0.1, values)
+    assert frame.shape == (16, 16)
@@ -0,0 +1,78 @@
+"""Benchmarks for message handling and entity property hot paths.
+
+Run from the repository root and compare against the stored baseline:
+
+    pytest benchmarks/bench_hot_paths.py --benchmark-storage=benchmarks/results \
+        --benchmark-compare=0001 --benchmark-compare-fail=mean:25%
+
+Record a new baseline with ``--benchmark-save=baseline`` instead of
+``--benchmark-compare`` when a slowdown is intended.
+"""
+from __future__ import annotations
+
+import pytest
+
+from benchmarks.payloads import make_data, make_messages
+from custom_components.ikea_obegraensad.light import IkeaLedLight
+from custom_components.ikea_obegraensad.select import IkeaLedPluginSelect
+from custom_components.ikea_obegraensad.sensor import (
+    IkeaLedActivePluginSensor,
+    IkeaLedBrightnessSensor,
+    IkeaLedScheduleStatusSensor,
+)
+
+MESSAGE_BURST = 1000
+PLUGIN_COUNTS = [10, 100, 1000]
+
+
+def test_handle_ws_message_burst(benchmark, coordinator, event_loop_runner):
+    """Receive and apply a burst of state broadcasts."""
+    messages = make_messages(MESSAGE_BURST)
+
+    connection = coordinator.connection
+
+    async def handle_all():
+        for message in messages:
+            await connection._handle_ws_message(message)
+            while len(connection._inbound):
+                connection._notify_listeners(
+                    connection._apply_ws_data(connection._inbound.get_nowait())
+                )
+
+    benchmark(lambda: event_loop_runner(handle_all()))
+
+
+@pytest.mark.parametrize("plugin_count", PLUGIN_COUNTS)
+def test_plugin_select_options(benchmark, coordinator, entry, plugin_count):
+    """Build the plugin select options."""
+    coordinator.data = make_data(plugin_count)
+    entity = IkeaLedPluginSelect(coordinator, entry)
+    benchmark(lambda: entity.options)
+
+
+@pytest.mark.parametrize("plugin_count", PLUGIN_COUNTS)
+def test_plugin_select_current_option(benchmark, coordinator, entry, plugin_count):
+    """Look up the plugin select's current option."""
+    coordinator.data = make_data(plugin_count)
+    entity = IkeaLedPluginSelect(coordinator, entry)
+    benchmark(lambda: entity.current_option)
+
+
+@pytest.mark.parametrize("plugin_count", PLUGIN_COUNTS)
+def test_active_plugin_native_value(benchmark, coordinator, entry, plugin_count):
+    """Look up the active plugin sensor's value."""
+    coordinator.data = make_data(plugin_count)
+    entity = IkeaLedActivePluginSensor(coordinator, entry)
+    benchmark(lambda: entity.native_value)
+
+
+@pytest.mark.parametrize("plugin_count", PLUGIN_COUNTS)
+@pytest.mark.parametrize(
+    "entity_class",
+    [IkeaLedLight, IkeaLedActivePluginSensor, IkeaLedScheduleStatusSensor, IkeaLedBrightnessSensor],
+)
+def test_extra_state_attributes(benchmark, coordinator, entry, entity_class, plugin_count):
+    """Build extra state attributes."""
+    coordinator.data = make_data(plugin_count)
+    entity = entity_class(coordinator, entry)
+    benchmark(lambda: entity.extra_state_attributes)
@@ -0,0 +1,36 @@
+"""Fixtures for the hot path benchmarks."""
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.ikea_obegraensad.connection import IkeaLedConnection
+from custom_components.ikea_obegraensad.coordinator import IkeaLedCoordinator
+
+
+@pytest.fixture
+def coordinator() -> IkeaLedCoordinator:
+    """Return a coordinator whose connection does not open a socket."""
+    hass = MagicMock()
+    hass.data = {}
+    with patch.object(IkeaLedConnection, "start"):
+        return IkeaLedCoordinator(hass, "192.0.2.1")
+
+
+@pytest.fixture
+def entry() -> MagicMock:
+    """Return a minimal config entry."""
+    entry = MagicMock()
+    entry.entry_id = "benchmark"
+    entry.options = {}
+    return entry
+
+
+@pytest.fixture
+def event_loop_runner():
+    """Return a function running a coroutine on a private event loop."""
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.close()
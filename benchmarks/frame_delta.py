@@ -0,0 +1,100 @@
+"""Benchmark frame delta encoding for typical HA-side drawing workloads.
+
+Run from the repository root:
+
+    python -m benchmarks.frame_delta
+
+Reports the bytes on the wire per frame for full frames versus the
+automatically chosen delta encoding, and how many frames per second the
+encoder can produce.
+"""
+from __future__ import annotations
+
+import math
+import time
+from typing import Callable, Iterator
+
+from custom_components.ikea_obegraensad.const import PANEL_PIXELS, PANEL_SIZE
+from custom_components.ikea_obegraensad.frame import (
+    encode_frame_update,
+    full_frame_message,
+    messages_size,
+)
+
+FRAMES = 2000
+
+# 3x5 digit glyphs, one string per row
+DIGITS = {
+    "0": ["###", "#.#", "#.#", "#.#", "###"],
+    "1": [".#.", "##.", ".#.", ".#.", "###"],
+    "2": ["###", "..#", "###", "#..", "###"],
+    "3": ["###", "..#", "###", "..#", "###"],
+    "4": ["#.#", "#.#", "###", "..#", "..#"],
+    "5": ["###", "#..", "###", "..#", "###"],
+    "6": ["###", "#..", "###", "#.#", "###"],
+    "7": ["###", "..#", "..#", "..#", "..#"],
+    "8": ["###", "#.#", "###", "#.#", "###"],
+    "9": ["###", "#.#", "###", "..#", "###"],
+}
+
+
+def _draw_digit(pixels: bytearray, digit: str, x: int, y: int) -> None:
+    for row, line in enumerate(DIGITS[digit]):
+        for col, cell in enumerate(line):
+            if cell == "#":
+                pixels[(y + row) * PANEL_SIZE + x + col] = 255
+
+
+def clock_frames() -> Iterator[bytes]:
+    """HH:MM clock advancing one minute per frame."""
+    for minute in range(FRAMES):
+        pixels = bytearray(PANEL_PIXELS)
+        text = f"{(minute // 60) % 24:02d}{minute % 60:02d}"
+        for position, digit in enumerate(text):
+            _draw_digit(pixels, digit, 4 + 5 * (position % 2), 1 + 8 * (position // 2))
+        yield bytes(pixels)
+
+
+def graph_frames() -> Iterator[bytes]:
+    """Bar graph scrolling one column per frame."""
+    heights = [0] * PANEL_SIZE
+    for step in range(FRAMES):
+        heights = heights[1:] + [int(8 + 7 * math.sin(step / 5))]
+        pixels = bytearray(PANEL_PIXELS)
+        for x, height in enumerate(heights):
+            for y in range(PANEL_SIZE - height, PANEL_SIZE):
+                pixels[y * PANEL_SIZE + x] = 255
+        yield bytes(pixels)
+
+
+def blink_frames() -> Iterator[bytes]:
+    """Status indicator toggling a single pixel."""
+    for step in range(FRAMES):
+        pixels = bytearray(PANEL_PIXELS)
+        pixels[0] = 255 if step % 2 else 0
+        yield bytes(pixels)
+
+
+def run(name: str, workload: Callable[[], Iterator[bytes]]) -> None:
+    frames = list(workload())
+    full_bytes = sum(messages_size([full_frame_message(frame)]) for frame in frames)
+    
+    updates = []
+    start = time.perf_counter()
+    for previous, frame in zip([None] + frames, frames):
+        updates.append(encode_frame_update(previous, frame))
+    elapsed = time.perf_counter() - start
+    delta_bytes = sum(messages_size(messages) for messages in updates)
+    
+    print(
+        f"{name:<8} full {full_bytes / len(frames):8.1f} B/frame   "
+        f"delta {delta_bytes / len(frames):8.1f} B/frame   "
+        f"saved {100 * (1 - delta_bytes / full_bytes):5.1f}%   "
+        f"{len(frames) / elapsed:10.0f} frames/s"
+    )
+
+
+if __name__ == "__main__":
+    run("clock", clock_frames)
+    run("graph", graph_frames)
+    run("blink", blink_frames)
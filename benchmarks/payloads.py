@@ -0,0 +1,30 @@
+"""Synthetic firmware payloads for the benchmarks."""
+from __future__ import annotations
+
+import json
+from typing import Any
+
+
+def make_plugins(count: int) -> list[dict[str, Any]]:
+    """Return a synthetic firmware plugin list."""
+    return [{"id": plugin_id, "name": f"Plugin {plugin_id}"} for plugin_id in range(1, count + 1)]
+
+
+def make_data(plugin_count: int) -> dict[str, Any]:
+    """Return coordinator data with the last plugin active (worst case lookup)."""
+    return {
+        "brightness": 128,
+        "rotation": 1,
+        "plugin": plugin_count,
+        "scheduleActive": True,
+        "schedule": [{"pluginId": 1, "duration": 60}],
+        "plugins": make_plugins(plugin_count),
+    }
+
+
+def make_messages(count: int) -> list[str]:
+    """Return a burst of state broadcasts as the firmware sends them."""
+    return [
+        json.dumps({"brightness": index % 256, "rotation": index % 4, "plugin": 1 + index % 10})
+        for index in range(count)
+    ]
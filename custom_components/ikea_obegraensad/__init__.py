@@ -2,19 +2,43 @@
 from __future__ import annotations
 
 import logging
+import os
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.storage import STORAGE_DIR
+from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN
+from .const import (
+    CONF_RECORDER_MINUTES,
+    DATA_PLAYLIST_SCHEDULER,
+    DEFAULT_RECORDER_MINUTES,
+    DOMAIN,
+)
 from .coordinator import IkeaLedCoordinator
+from .services import async_setup_services
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: list[Platform] = [Platform.LIGHT, Platform.SELECT, Platform.SENSOR, Platform.BUTTON]
+PLATFORMS: list[Platform] = [
+    Platform.LIGHT,
+    Platform.SELECT,
+    Platform.SENSOR,
+    Platform.BUTTON,
+    Platform.CAMERA,
+]
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the IKEA OBEGRÄNSAD LED Control services."""
+    async_setup_services(hass)
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -27,21 +51,56 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         await coordinator.async_config_entry_first_refresh()
     except Exception as ex:
         _LOGGER.exception("Error setting up IKEA OBEGRÄNSAD LED device")
+        await coordinator.async_shutdown()
         raise ConfigEntryNotReady from ex
 
+    if minutes := entry.options.get(CONF_RECORDER_MINUTES, DEFAULT_RECORDER_MINUTES):
+        path = _recording_path(hass, entry)
+        try:
+            await coordinator.async_start_recorder(path, minutes)
+        except OSError as ex:
+            _LOGGER.warning("Recording disabled, cannot open %s: %s", path, ex)
+
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
     return True
 
 
+def _recording_path(hass: HomeAssistant, entry: ConfigEntry) -> str:
+    """Return the path of the entry's state and frame recording."""
+    return hass.config.path(STORAGE_DIR, f"{DOMAIN}.{entry.entry_id}.rec")
+
+
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        if scheduler := hass.data[DOMAIN].get(DATA_PLAYLIST_SCHEDULER):
+            scheduler.async_stop(entry.entry_id)
         coordinator = hass.data[DOMAIN][entry.entry_id]
         await coordinator.async_shutdown()
         hass.data[DOMAIN].pop(entry.entry_id)
+        
+        if scheduler and not any(
+            isinstance(value, IkeaLedCoordinator) for value in hass.data[DOMAIN].values()
+        ):
+            # Last panel gone: cancel the shared timer
+            scheduler.async_shutdown()
+            hass.data[DOMAIN].pop(DATA_PLAYLIST_SCHEDULER)
+
+    return unload_ok
+
 
-    return unload_ok
\ No newline at end of file
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the entry's recording."""
+    path = _recording_path(hass, entry)
+    if await hass.async_add_executor_job(os.path.exists, path):
+        await hass.async_add_executor_job(os.remove, path)
@@ -7,12 +7,11 @@ from typing import Any
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import DOMAIN, PRIORITY_INTERACTIVE
 from .coordinator import IkeaLedCoordinator
+from .entity import IkeaLedEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -33,7 +32,7 @@ async def async_setup_entry(
     async_add_entities(buttons)
 
 
-class IkeaLedBaseButton(CoordinatorEntity[IkeaLedCoordinator], ButtonEntity):
+class IkeaLedBaseButton(IkeaLedEntity, ButtonEntity):
     """Base class for IKEA OBEGRÄNSAD LED buttons."""
 
     def __init__(
@@ -45,25 +44,13 @@ class IkeaLedBaseButton(CoordinatorEntity[IkeaLedCoordinator], ButtonEntity):
         icon: str | None = None,
     ) -> None:
         """Initialize the button."""
-        super().__init__(coordinator)
-        self._entry = entry
+        super().__init__(coordinator, entry)
         self._button_type = button_type
         self._attr_unique_id = f"{entry.entry_id}_{button_type}"
         self._attr_name = f"IKEA OBEGRÄNSAD {name}"
         if icon:
             self._attr_icon = icon
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            name="IKEA OBEGRÄNSAD LED",
-            manufacturer="IKEA (Modified)",
-            model="OBEGRÄNSAD",
-            configuration_url=f"http://{self.coordinator.host}",
-        )
-
 
 class IkeaLedRotateLeftButton(IkeaLedBaseButton):
     """Button to rotate display left."""
@@ -82,7 +69,7 @@ class IkeaLedRotateLeftButton(IkeaLedBaseButton):
         """Handle the button press."""
         try:
             await self.hass.async_add_executor_job(
-                self.coordinator.set_rotation, "left"
+                self.coordinator.set_rotation, "left", PRIORITY_INTERACTIVE
             )
             # Gentle refresh to ensure UI updates
             await self.coordinator.async_refresh_after_command()
@@ -107,7 +94,7 @@ class IkeaLedRotateRightButton(IkeaLedBaseButton):
         """Handle the button press."""
         try:
             await self.hass.async_add_executor_job(
-                self.coordinator.set_rotation, "right"
+                self.coordinator.set_rotation, "right", PRIORITY_INTERACTIVE
             )
             # Gentle refresh to ensure UI updates
             await self.coordinator.async_refresh_after_command()
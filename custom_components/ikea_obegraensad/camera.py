@@ -0,0 +1,96 @@
+"""Camera platform for IKEA OBEGRÄNSAD LED Control."""
+from __future__ import annotations
+
+import logging
+import struct
+import zlib
+
+from homeassistant.components.camera import Camera
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN, PANEL_SIZE, PREVIEW_SCALE
+from .coordinator import IkeaLedCoordinator
+from .entity import IkeaLedEntity
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the IKEA OBEGRÄNSAD LED camera platform."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    
+    async_add_entities([IkeaLedPreviewCamera(coordinator, entry)])
+
+
+def _png_chunk(chunk_type: bytes, data: bytes) -> bytes:
+    """Build a single PNG chunk."""
+    return (
+        struct.pack(">I", len(data))
+        + chunk_type
+        + data
+        + struct.pack(">I", zlib.crc32(chunk_type + data) & 0xFFFFFFFF)
+    )
+
+
+def encode_frame_png(frame: bytes, scale: int = PREVIEW_SCALE) -> bytes:
+    """Encode a row-major 16x16 brightness frame as an upscaled grayscale PNG."""
+    size = PANEL_SIZE * scale
+    rows = []
+    for y in range(PANEL_SIZE):
+        row = frame[y * PANEL_SIZE:(y + 1) * PANEL_SIZE]
+        # Each scanline starts with filter type 0 (none)
+        scanline = b"\x00" + bytes(value for value in row for _ in range(scale))
+        rows.append(scanline * scale)
+    
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + _png_chunk(b"IHDR", struct.pack(">IIBBBBB", size, size, 8, 0, 0, 0, 0))
+        + _png_chunk(b"IDAT", zlib.compress(b"".join(rows)))
+        + _png_chunk(b"IEND", b"")
+    )
+
+
+class IkeaLedPreviewCamera(IkeaLedEntity, Camera):
+    """Live preview of what the IKEA OBEGRÄNSAD LED panel is showing."""
+
+    def __init__(
+        self,
+        coordinator: IkeaLedCoordinator,
+        entry: ConfigEntry,
+    ) -> None:
+        """Initialize the camera."""
+        super().__init__(coordinator, entry)
+        Camera.__init__(self)
+        # Camera.__init__ sets content_type to JPEG on the instance
+        self.content_type = "image/png"
+        self._attr_unique_id = f"{entry.entry_id}_preview"
+        self._attr_name = "IKEA OBEGRÄNSAD Preview"
+        self._attr_icon = "mdi:grid"
+        self._image_version: tuple[str, int] | None = None
+        self._image: bytes | None = None
+
+    async def async_camera_image(
+        self, width: int | None = None, height: int | None = None
+    ) -> bytes | None:
+        """Return the current (or replayed) frame, encoding it only when it has changed."""
+        version, frame = self.coordinator.replay.get_frame()
+        source = "replay"
+        if frame is None:
+            version, frame = self.coordinator.get_frame()
+            source = "live"
+        if frame is None:
+            return None
+        
+        version = (source, version)
+        if version != self._image_version:
+            self._image = encode_frame_png(frame)
+            self._image_version = version
+            _LOGGER.debug("Encoded preview frame version %s", version)
+        
+        return self._image
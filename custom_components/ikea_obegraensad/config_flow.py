@@ -8,11 +8,18 @@ import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_HOST
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
 
-from .const import DOMAIN
+from .const import (
+    CONF_MIN_STATE_INTERVAL,
+    CONF_RECORDER_MINUTES,
+    DEFAULT_MIN_STATE_INTERVAL,
+    DEFAULT_RECORDER_MINUTES,
+    DOMAIN,
+    MAX_RECORDER_MINUTES,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,6 +35,14 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> OptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return OptionsFlowHandler(config_entry)
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -61,13 +76,12 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     async def _test_connection(self, host: str) -> bool:
         """Test if we can connect to the device."""
+        # Import the coordinator to test connection
+        from .coordinator import IkeaLedCoordinator
+        
+        # Create a temporary coordinator for testing
+        test_coordinator = IkeaLedCoordinator(self.hass, host)
         try:
-            # Import the coordinator to test connection
-            from .coordinator import IkeaLedCoordinator
-            
-            # Create a temporary coordinator for testing
-            test_coordinator = IkeaLedCoordinator(self.hass, host)
-            
             # Give it time to establish WebSocket connection
             await asyncio.sleep(3)
             
@@ -87,9 +101,6 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 
             _LOGGER.info("Successfully connected to IKEA LED device at %s", host)
             
-            # Clean up test coordinator
-            await test_coordinator.async_shutdown()
-            
             return True
             
         except ConnectionError as ex:
@@ -101,6 +112,44 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         except Exception as ex:
             _LOGGER.exception("Error connecting to IKEA LED device at %s", host)
             raise CannotConnect from ex
+        finally:
+            # Clean up test coordinator
+            await test_coordinator.async_shutdown()
+
+
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle options for IKEA OBEGRÄNSAD LED Control."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize options flow."""
+        self.config_entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_MIN_STATE_INTERVAL,
+                        default=self.config_entry.options.get(
+                            CONF_MIN_STATE_INTERVAL, DEFAULT_MIN_STATE_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0, max=60)),
+                    vol.Optional(
+                        CONF_RECORDER_MINUTES,
+                        default=self.config_entry.options.get(
+                            CONF_RECORDER_MINUTES, DEFAULT_RECORDER_MINUTES
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=MAX_RECORDER_MINUTES)),
+                }
+            ),
+        )
 
 
 class CannotConnect(HomeAssistantError):
@@ -0,0 +1,427 @@
+"""Shared WebSocket connection for IKEA OBEGRÄNSAD LED Control."""
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import json
+import logging
+import threading
+from typing import Any, Callable, Coroutine, Dict, Optional
+
+import websockets
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    DATA_CONNECTIONS,
+    DOMAIN,
+    INBOUND_QUEUE_SIZE,
+    PANEL_PIXELS,
+    PRIORITY_AUTOMATION,
+    PRIORITY_BULK,
+    SHUTDOWN_TIMEOUT,
+    STREAM_TTL,
+)
+from .frame import encode_frame_update
+from .profiling import span
+from .queues import PriorityCommandQueue, SnapshotQueue
+
+_LOGGER = logging.getLogger(__name__)
+
+# Key used in change sets when the displayed frame changed, and for queued frames
+FRAME = "frame"
+
+# Seconds a blocking caller waits for its command to be sent
+SEND_TIMEOUT = 10
+
+ConnectionListener = Callable[[Dict[str, Any]], None]
+
+
+class IkeaLedConnection:
+    """WebSocket connection to one panel, shared by every consumer of its host.
+
+    The socket runs on its own event loop in a background thread. Listeners
+    are called from that thread with the fields that changed in each applied
+    snapshot, so they must hand work over to their own loop.
+    """
+
+    def __init__(self, host: str) -> None:
+        """Initialize."""
+        self.host = host
+        self.ws_url = f"ws://{host}/ws"
+        self.websocket: Optional[websockets.WebSocketClientProtocol] = None
+        self.ws_connected = False
+        self.refs = 0
+        self._state = {
+            "brightness": 0,
+            "rotation": 0,
+            "plugin": None,
+            "scheduleActive": False,
+            "schedule": [],
+            "plugins": []
+        }
+        self._lock = threading.Lock()
+        self._state_changed = threading.Condition(self._lock)
+        self._listeners: list[ConnectionListener] = []
+        self._inbound = SnapshotQueue(INBOUND_QUEUE_SIZE)
+        self._outbound = PriorityCommandQueue()
+        self._frame: Optional[bytes] = None
+        self._frame_version = 0
+        self._sent_frame: Optional[bytes] = None
+        self._ws_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._ws_thread: Optional[threading.Thread] = None
+        self._apply_task: Optional[asyncio.Task] = None
+        self._write_task: Optional[asyncio.Task] = None
+        self._stop_event = threading.Event()
+
+    def start(self) -> None:
+        """Start the WebSocket connection in a background thread."""
+        loop = asyncio.new_event_loop()
+        self._ws_loop = loop
+
+        def run_async_loop():
+            asyncio.set_event_loop(loop)
+            try:
+                loop.run_until_complete(self._websocket_loop())
+            finally:
+                loop.run_until_complete(loop.shutdown_asyncgens())
+                loop.close()
+                _LOGGER.debug("WebSocket thread for %s stopped", self.host)
+        
+        self._ws_thread = threading.Thread(target=run_async_loop, daemon=True)
+        self._ws_thread.start()
+
+    def add_listener(self, listener: ConnectionListener) -> Callable[[], None]:
+        """Register a change listener; return a function removing it."""
+        with self._lock:
+            self._listeners.append(listener)
+
+        def remove_listener() -> None:
+            with self._lock:
+                if listener in self._listeners:
+                    self._listeners.remove(listener)
+
+        return remove_listener
+
+    async def _websocket_loop(self):
+        """Main WebSocket connection loop, run until stop() cancels it."""
+        self._apply_task = asyncio.create_task(self._apply_loop())
+        self._write_task = asyncio.create_task(self._write_loop())
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    async with websockets.connect(
+                        self.ws_url, close_timeout=SHUTDOWN_TIMEOUT
+                    ) as websocket:
+                        self.websocket = websocket
+                        self.ws_connected = True
+                        _LOGGER.debug("WebSocket connected to %s", self.ws_url)
+                        
+                        while True:
+                            try:
+                                message = await websocket.recv()
+                                with span("receive"):
+                                    await self._handle_ws_message(message)
+                            except websockets.ConnectionClosed:
+                                break
+                except Exception as ex:
+                    _LOGGER.debug("WebSocket connection error: %s", ex)
+                finally:
+                    self.ws_connected = False
+                    self.websocket = None
+                
+                # Wait before reconnecting
+                await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            _LOGGER.debug("WebSocket loop for %s cancelled", self.host)
+        finally:
+            self._apply_task.cancel()
+            self._write_task.cancel()
+            await asyncio.gather(self._apply_task, self._write_task, return_exceptions=True)
+
+    async def _handle_ws_message(self, message: str):
+        """Handle incoming WebSocket messages by queueing them for the apply loop."""
+        try:
+            with span("parse"):
+                data = json.loads(message)
+        except json.JSONDecodeError as ex:
+            _LOGGER.warning("Error parsing WebSocket message: %s", ex)
+            return
+        
+        if isinstance(data, dict):
+            self._inbound.put(data)
+
+    async def _apply_loop(self):
+        """Apply queued snapshots to the cached state and notify listeners."""
+        while True:
+            data = await self._inbound.get()
+            try:
+                with span("apply"):
+                    changes = self._apply_ws_data(data)
+                if changes:
+                    with span("dispatch"):
+                        self._notify_listeners(changes)
+            except Exception as ex:
+                _LOGGER.debug("Error applying WebSocket message: %s", ex)
+
+    def _apply_ws_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Apply a decoded state snapshot; return the fields that changed."""
+        changes = {}
+        with self._lock:
+            for key in self._state:
+                if key in data and data[key] != self._state[key]:
+                    changes[key] = self._state[key] = data[key]
+            if "plugin" in changes:
+                # Another plugin owns the screen now, so the next frame is sent in full
+                self._sent_frame = None
+            frame = self._parse_frame(data.get("data"))
+            if frame is not None and self._store_frame(frame):
+                changes[FRAME] = frame
+            self._state_changed.notify_all()
+        return changes
+
+    def _notify_listeners(self, changes: Dict[str, Any]) -> None:
+        """Call every listener with the changed fields."""
+        with self._lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            try:
+                listener(changes)
+            except Exception:
+                _LOGGER.exception("Error in connection listener for %s", self.host)
+
+    async def _send_ws_message(self, data: Dict[str, Any]):
+        """Send a message through the WebSocket connection."""
+        if not self.ws_connected or not self.websocket:
+            raise ConnectionError("WebSocket connection is not available")
+        
+        try:
+            await self.websocket.send(json.dumps(data))
+        except websockets.ConnectionClosed as ex:
+            _LOGGER.debug("WebSocket connection closed while sending message")
+            self.ws_connected = False
+            # Callers handle ConnectionError, which ConnectionClosed is not
+            raise ConnectionError("WebSocket connection closed") from ex
+        except Exception as ex:
+            _LOGGER.warning("Error sending WebSocket message: %s", ex)
+            raise
+
+    async def _send_ws_messages(self, messages: list[Dict[str, Any]]):
+        """Send several messages back-to-back without waiting for replies."""
+        with span("send"):
+            for data in messages:
+                await self._send_ws_message(data)
+
+    async def _write_loop(self):
+        """Send queued commands, most urgent first."""
+        while True:
+            command = await self._outbound.get()
+            try:
+                await self._send_ws_messages(command.build())
+            except Exception as ex:
+                with self._lock:
+                    # The panel may not have the last frame, so send the next one in full
+                    self._sent_frame = None
+                if not command.future.done():
+                    command.future.set_exception(ex)
+            else:
+                if not command.future.done():
+                    command.future.set_result(True)
+
+    async def _async_enqueue(
+        self,
+        build: Callable[[], list[Dict[str, Any]]],
+        priority: int,
+        key: Optional[str] = None,
+        ttl: Optional[float] = None,
+    ) -> bool:
+        """Queue a command on the WebSocket loop and wait until it is sent or dropped."""
+        return await self._outbound.put(build, priority, key, ttl)
+
+    def _submit(self, coro: Coroutine[Any, Any, bool]) -> concurrent.futures.Future[bool]:
+        """Schedule a coroutine on the WebSocket loop."""
+        if not self.ws_connected or self._ws_loop is None:
+            coro.close()
+            raise ConnectionError("WebSocket connection is not available")
+        return asyncio.run_coroutine_threadsafe(coro, self._ws_loop)
+
+    def send(
+        self, messages: list[Dict[str, Any]], priority: int = PRIORITY_AUTOMATION
+    ) -> bool:
+        """Send messages as one pipelined burst; blocks until they are written."""
+        return self._submit(
+            self._async_enqueue(lambda: messages, priority)
+        ).result(timeout=SEND_TIMEOUT)
+
+    async def async_send(
+        self, messages: list[Dict[str, Any]], priority: int = PRIORITY_AUTOMATION
+    ) -> bool:
+        """Send messages as one pipelined burst from another event loop."""
+        return await asyncio.wrap_future(
+            self._submit(self._async_enqueue(lambda: messages, priority))
+        )
+
+    def _build_frame_update(self, frame: bytes, partial: bool) -> list[Dict[str, Any]]:
+        """Return the messages drawing a frame and record it as sent."""
+        with self._lock:
+            messages = encode_frame_update(self._sent_frame, frame, partial)
+            self._sent_frame = frame
+            changed = self._store_frame(frame)
+        if changed:
+            self._notify_listeners({FRAME: frame})
+        return messages
+
+    def _frame_command(
+        self, frame: bytes, partial: bool, priority: int
+    ) -> Coroutine[Any, Any, bool]:
+        """Return the coroutine queueing a droppable frame update."""
+        return self._async_enqueue(
+            lambda: self._build_frame_update(frame, partial), priority, FRAME, STREAM_TTL
+        )
+
+    def send_frame(
+        self, frame: bytes, partial: bool = True, priority: int = PRIORITY_BULK
+    ) -> bool:
+        """Draw a frame; blocks until sent. Returns False if a newer frame replaced it.
+
+        The delta against the last frame sent is computed right before sending,
+        so dropped frames never leave the panel out of step.
+        """
+        return self._submit(self._frame_command(frame, partial, priority)).result(
+            timeout=SEND_TIMEOUT
+        )
+
+    async def async_send_frame(
+        self, frame: bytes, partial: bool = True, priority: int = PRIORITY_BULK
+    ) -> bool:
+        """Draw a frame from another event loop; see send_frame."""
+        return await asyncio.wrap_future(
+            self._submit(self._frame_command(frame, partial, priority))
+        )
+
+    async def async_run_in_thread(self, func: Callable[[], Any]) -> None:
+        """Run a function in the WebSocket thread and wait for it."""
+        if self._ws_loop is None or self._ws_loop.is_closed():
+            raise ConnectionError("WebSocket thread is not running")
+
+        async def run() -> None:
+            func()
+
+        await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(run(), self._ws_loop))
+
+    @staticmethod
+    def _parse_frame(value: Any) -> Optional[bytes]:
+        """Return a broadcast pixel buffer as bytes, or None if it is not one."""
+        if not isinstance(value, list) or len(value) != PANEL_PIXELS:
+            return None
+        try:
+            return bytes(value)
+        except (TypeError, ValueError):
+            return None
+
+    def _store_frame(self, frame: bytes) -> bool:
+        """Remember the displayed frame; must be called with the lock held."""
+        if frame == self._frame:
+            return False
+        self._frame = frame
+        self._frame_version += 1
+        return True
+
+    def get(self, key: str) -> Any:
+        """Return a cached state field."""
+        with self._lock:
+            return self._state[key]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return a copy of the cached state."""
+        with self._lock:
+            return dict(self._state)
+
+    def get_frame(self) -> tuple[int, Optional[bytes]]:
+        """Return the last known frame and its version (bumped on every change)."""
+        with self._lock:
+            return self._frame_version, self._frame
+
+    @property
+    def merged_messages(self) -> int:
+        """Return how many inbound messages were merged into a queued snapshot."""
+        return self._inbound.merged
+
+    @property
+    def dropped_commands(self) -> int:
+        """Return how many queued outbound commands were superseded or expired."""
+        return self._outbound.dropped
+
+    def wait_for_state(self, key: str, value: Any, timeout: float) -> bool:
+        """Block until the device echoes the given state value."""
+        with self._state_changed:
+            return self._state_changed.wait_for(
+                lambda: self._state[key] == value, timeout=timeout
+            )
+
+    async def _async_stop_websocket(self) -> None:
+        """Close the socket and cancel every other task on the WebSocket loop."""
+        if self.websocket is not None:
+            await self.websocket.close()
+        # Release callers blocked on commands that will never be sent
+        self._outbound.clear()
+        for task in asyncio.all_tasks():
+            if task is not asyncio.current_task():
+                task.cancel()
+
+    def stop(self) -> None:
+        """Ask the WebSocket thread to close the socket and exit."""
+        self._stop_event.set()
+        self.ws_connected = False
+        
+        if self._ws_loop is not None and not self._ws_loop.is_closed():
+            try:
+                asyncio.run_coroutine_threadsafe(self._async_stop_websocket(), self._ws_loop)
+            except RuntimeError:
+                # The loop closed between the check and the call
+                pass
+
+    def join(self, timeout: float) -> bool:
+        """Wait for the WebSocket thread to exit; return True if it did."""
+        if self._ws_thread is not None:
+            self._ws_thread.join(timeout)
+            return not self._ws_thread.is_alive()
+        return True
+
+
+@callback
+def async_acquire_connection(hass: HomeAssistant, host: str) -> IkeaLedConnection:
+    """Return the shared connection for a host, opening it for the first user."""
+    connections: dict[str, IkeaLedConnection] = hass.data.setdefault(
+        DOMAIN, {}
+    ).setdefault(DATA_CONNECTIONS, {})
+    
+    connection = connections.get(host)
+    if connection is None:
+        connection = connections[host] = IkeaLedConnection(host)
+        connection.start()
+        _LOGGER.debug("Opened shared connection to %s", host)
+    connection.refs += 1
+    return connection
+
+
+async def async_release_connection(hass: HomeAssistant, connection: IkeaLedConnection) -> None:
+    """Drop one reference to a connection, closing it when the last user releases it."""
+    if connection.refs <= 0:
+        _LOGGER.debug("Connection to %s released more often than acquired", connection.host)
+        return
+    connection.refs -= 1
+    if connection.refs > 0:
+        return
+    
+    connections = hass.data.get(DOMAIN, {}).get(DATA_CONNECTIONS, {})
+    if connections.get(connection.host) is connection:
+        connections.pop(connection.host)
+    
+    connection.stop()
+    if not await hass.async_add_executor_job(connection.join, SHUTDOWN_TIMEOUT):
+        _LOGGER.warning(
+            "WebSocket thread for %s did not stop within %s seconds",
+            connection.host,
+            SHUTDOWN_TIMEOUT,
+        )
+    _LOGGER.debug("Closed shared connection to %s", connection.host)
@@ -4,15 +4,98 @@ DOMAIN = "ikea_obegraensad"
 
 # Configuration
 CONF_HOST = "host"
+CONF_MIN_STATE_INTERVAL = "min_state_interval"
+CONF_RECORDER_MINUTES = "recorder_minutes"
 
 # Default values
 DEFAULT_NAME = "IKEA OBEGRÄNSAD LED"
 DEFAULT_PORT = 80
 # Fallback update interval (WebSocket provides real-time updates)
 DEFAULT_UPDATE_INTERVAL = 300  # 5 minutes as fallback only
+# Minimum seconds between device-driven state writes per entity
+DEFAULT_MIN_STATE_INTERVAL = 1.0
+# Seconds after a user command during which its echo is written unthrottled
+COMMAND_ECHO_WINDOW = 2.0
+
+# Panel
+PANEL_SIZE = 16  # The panel is a 16x16 grid of single-colour LEDs
+PANEL_PIXELS = PANEL_SIZE * PANEL_SIZE
+PREVIEW_SCALE = 16  # Upscale factor for the preview camera image
+
+# Recorder
+DEFAULT_RECORDER_MINUTES = 10  # History kept on disk; 0 disables recording
+MAX_RECORDER_MINUTES = 120
+RECORDER_FRAME_INTERVAL = 1.0  # Seconds between recorded frames while streaming
+RECORDER_STATE_RATE = 4  # State changes per second the history is sized for
+MAX_REPLAY_SPEED = 100
+REPLAY_TARGET_PANEL = "panel"
+REPLAY_TARGET_PREVIEW = "preview"
+
+# Profiling
+DEFAULT_PROFILE_DURATION = 30  # Seconds
+MAX_PROFILE_DURATION = 600
+
+# Effects
+DRAW_PLUGIN_NAME = "Draw"  # Firmware plugin that shows frames sent over /ws
+DEFAULT_EFFECT_FPS = 10
+MAX_EFFECT_FPS = 30
+EFFECT_OPTION_PREFIX = "Effect: "
+
+# Outbound command priorities, most urgent first
+PRIORITY_INTERACTIVE = 0  # Commands from entities the user operates
+PRIORITY_AUTOMATION = 1  # Services, playlists and other automation traffic
+PRIORITY_BULK = 2  # Frame streaming and other droppable bulk traffic
+# Seconds a queued streaming frame stays worth sending
+STREAM_TTL = 1.0
+
+# Inbound WebSocket snapshots queued before newer ones are merged into the newest
+INBOUND_QUEUE_SIZE = 8
+
+# Seconds to wait for the socket to close and background threads to exit on unload
+SHUTDOWN_TIMEOUT = 5.0
+
+# Rotation
+ROTATION_STEPS = 4  # Firmware rotates in 90° steps
+ROTATION_CONFIRM_TIMEOUT = 2.0  # Seconds to wait for the echoed rotation
+
+# Snapshots kept per panel before the oldest is discarded
+MAX_SNAPSHOTS = 10
+
+# Keys of integration-wide objects in hass.data[DOMAIN]
+DATA_CONNECTIONS = "connections"
+DATA_PLAYLIST_SCHEDULER = "playlist_scheduler"
+
+# Shortest time a playlist item is shown, in seconds
+MIN_PLAYLIST_ITEM_DURATION = 1
+
+# Services
+SERVICE_START_PLAYLIST = "start_playlist"
+SERVICE_STOP_PLAYLIST = "stop_playlist"
+SERVICE_SKIP_PLAYLIST = "skip_playlist"
+SERVICE_START_EFFECT = "start_effect"
+SERVICE_STOP_EFFECT = "stop_effect"
+SERVICE_PROFILE = "profile"
+SERVICE_SNAPSHOT = "snapshot"
+SERVICE_RESTORE = "restore"
+SERVICE_REPLAY = "replay"
+SERVICE_STOP_REPLAY = "stop_replay"
 
 # Attributes
 ATTR_PLUGIN = "plugin"
 ATTR_ROTATION = "rotation"
 ATTR_SCHEDULE_ACTIVE = "schedule_active"
-ATTR_AVAILABLE_PLUGINS = "available_plugins"
\ No newline at end of file
+ATTR_AVAILABLE_PLUGINS = "available_plugins"
+ATTR_BRIGHTNESS = "brightness"
+ATTR_CLOCK = "clock"
+ATTR_DEVICE_ID = "device_id"
+ATTR_DURATION = "duration"
+ATTR_END = "end"
+ATTR_EFFECT = "effect"
+ATTR_FPS = "fps"
+ATTR_ITEMS = "items"
+ATTR_NAME = "name"
+ATTR_REPEAT = "repeat"
+ATTR_SOURCE_ENTITIES = "source_entities"
+ATTR_SPEED = "speed"
+ATTR_START = "start"
+ATTR_TARGET = "target"
\ No newline at end of file
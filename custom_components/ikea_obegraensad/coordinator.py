@@ -2,18 +2,31 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
-import threading
-import time
 from datetime import timedelta
 from typing import Any, Dict, Optional
 
-import websockets
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN
+from .connection import (
+    FRAME,
+    IkeaLedConnection,
+    async_acquire_connection,
+    async_release_connection,
+)
+from .const import (
+    DOMAIN,
+    DRAW_PLUGIN_NAME,
+    PANEL_PIXELS,
+    PRIORITY_AUTOMATION,
+    ROTATION_CONFIRM_TIMEOUT,
+    ROTATION_STEPS,
+)
+from .effects import EffectRunner
+from .profiling import span
+from .recorder import PanelRecorder, ReplayRunner
+from .snapshot import SnapshotStack
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,21 +38,10 @@ class IkeaLedCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Initialize."""
         self.host = host
         self.base_url = f"http://{host}/api"
-        self.ws_url = f"ws://{host}/ws"
-        self.websocket: Optional[websockets.WebSocketClientProtocol] = None
-        self.ws_connected = False
-        self._state = {
-            "brightness": 0,
-            "rotation": 0,
-            "plugin": None,
-            "scheduleActive": False,
-            "schedule": [],
-            "plugins": []
-        }
-        self._ws_lock = threading.Lock()
-        self._last_state = {}
-        self._ws_thread = None
-        self._monitor_thread = None
+        # Firmware accepts single-pixel "led" events alongside full "screen" frames
+        self.supports_partial_frames = True
+        self._change_pending = False
+        self._released = False
         
         super().__init__(
             hass,
@@ -48,144 +50,87 @@ class IkeaLedCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             update_interval=timedelta(seconds=60),  # WebSocket provides real-time updates
         )
         
-        # Start WebSocket and monitoring after coordinator is initialized
-        self._start_websocket()
-        self._start_monitoring()
-
-    def _start_websocket(self):
-        """Start the WebSocket connection in a background thread."""
-        def run_async_loop():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            loop.run_until_complete(self._websocket_loop())
-        
-        self._ws_thread = threading.Thread(target=run_async_loop, daemon=True)
-        self._ws_thread.start()
-
-    def _start_monitoring(self):
-        """Start the state monitoring in a background thread."""
-        def monitor_changes():
-            while True:
-                try:
-                    with self._ws_lock:
-                        current_state = dict(self._state)
-                    
-                    # Check for changes and trigger coordinator updates
-                    changes_detected = False
-                    for key, value in current_state.items():
-                        if key not in self._last_state or self._last_state[key] != value:
-                            if key in self._last_state:  # Don't log initial values
-                                _LOGGER.debug("Change detected: %s changed from %s to %s", 
-                                             key, self._last_state[key], value)
-                                changes_detected = True
-                            self._last_state[key] = value
-                    
-                    # Notify coordinator of changes
-                    if changes_detected:
-                        self.hass.loop.call_soon_threadsafe(
-                            lambda: self.hass.async_create_task(self._on_websocket_change())
-                        )
-                    
-                    time.sleep(0.5)  # Check every 500ms
-                except Exception as ex:
-                    _LOGGER.debug("Error in monitoring loop: %s", ex)
-                    time.sleep(1)
-        
-        self._monitor_thread = threading.Thread(target=monitor_changes, daemon=True)
-        self._monitor_thread.start()
-
-    async def _websocket_loop(self):
-        """Main WebSocket connection loop."""
-        while True:
-            try:
-                async with websockets.connect(self.ws_url) as websocket:
-                    self.websocket = websocket
-                    self.ws_connected = True
-                    _LOGGER.debug("WebSocket connected to %s", self.ws_url)
-                    
-                    while True:
-                        try:
-                            message = await websocket.recv()
-                            await self._handle_ws_message(message)
-                        except websockets.ConnectionClosed:
-                            break
-            except Exception as ex:
-                _LOGGER.debug("WebSocket connection error: %s", ex)
-            finally:
-                self.ws_connected = False
-                self.websocket = None
-            
-            # Wait before reconnecting
-            await asyncio.sleep(5)
+        # Share the host's WebSocket with any other consumer of the same panel
+        self._connection: IkeaLedConnection = async_acquire_connection(hass, host)
+        self._remove_connection_listener = self._connection.add_listener(
+            self._handle_connection_change
+        )
+        self.effects = EffectRunner(hass, self)
+        self.snapshots = SnapshotStack(self)
+        self.replay = ReplayRunner(hass, self)
+        self.recorder: Optional[PanelRecorder] = None
 
-    async def _handle_ws_message(self, message: str):
-        """Handle incoming WebSocket messages."""
-        try:
-            data = json.loads(message)
-            with self._ws_lock:
-                if "brightness" in data:
-                    self._state["brightness"] = data["brightness"]
-                if "rotation" in data:
-                    self._state["rotation"] = data["rotation"]
-                if "plugin" in data:
-                    self._state["plugin"] = data["plugin"]
-                if "scheduleActive" in data:
-                    self._state["scheduleActive"] = data["scheduleActive"]
-                if "schedule" in data:
-                    self._state["schedule"] = data["schedule"]
-                if "plugins" in data:
-                    self._state["plugins"] = data["plugins"]
-        except json.JSONDecodeError as ex:
-            _LOGGER.warning("Error parsing WebSocket message: %s", ex)
-
-    async def _send_ws_message(self, data: Dict[str, Any]):
-        """Send a message through the WebSocket connection."""
-        if not self.ws_connected or not self.websocket:
-            raise ConnectionError("WebSocket connection is not available")
-        
-        try:
-            await self.websocket.send(json.dumps(data))
-        except websockets.ConnectionClosed:
-            _LOGGER.debug("WebSocket connection closed while sending message")
-            self.ws_connected = False
-            raise
-        except Exception as ex:
-            _LOGGER.warning("Error sending WebSocket message: %s", ex)
-            raise
+    @property
+    def connection(self) -> IkeaLedConnection:
+        """Return the shared connection to the panel."""
+        return self._connection
 
-    def _send_ws_command(self, data: Dict[str, Any]) -> None:
-        """Helper method to send WebSocket commands."""
-        if not self.ws_connected:
-            raise ConnectionError("WebSocket connection is not available")
-        
-        # Create a new event loop for this thread
-        try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            loop.run_until_complete(self._send_ws_message(data))
-        finally:
-            loop.close()
+    @property
+    def ws_connected(self) -> bool:
+        """Return True if the WebSocket is connected."""
+        return self._connection.ws_connected
+
+    def _handle_connection_change(self, changes: Dict[str, Any]) -> None:
+        """Schedule a coordinator update for state changes; runs in the socket thread."""
+        if set(changes) == {FRAME} or self._change_pending:
+            return
+        # Coalesce bursts into one pending update on the HA loop
+        self._change_pending = True
+        self.hass.loop.call_soon_threadsafe(self._async_handle_websocket_change)
 
-    async def _on_websocket_change(self) -> None:
+    @callback
+    def _async_handle_websocket_change(self) -> None:
         """Handle WebSocket state changes."""
+        self._change_pending = False
         try:
             # Update the coordinator's data with current state
-            with self._ws_lock:
-                current_data = dict(self._state)
-            
-            self.data = current_data
-            self.async_update_listeners()
+            self.data = self._connection.snapshot()
+            with span("update_listeners"):
+                self.async_update_listeners()
             _LOGGER.debug("WebSocket change triggered HA update")
                 
         except Exception as ex:
             _LOGGER.debug("Failed to handle WebSocket change: %s", ex)
 
+    def _send_ws_command(
+        self, data: Dict[str, Any], priority: int = PRIORITY_AUTOMATION
+    ) -> None:
+        """Helper method to send WebSocket commands."""
+        self._send_ws_commands([data], priority)
+
+    def _send_ws_commands(
+        self, messages: list[Dict[str, Any]], priority: int = PRIORITY_AUTOMATION
+    ) -> None:
+        """Send WebSocket commands as one pipelined burst on the socket's loop."""
+        with span("command"):
+            self._connection.send(messages, priority)
+
+    async def async_send_commands(
+        self, messages: list[Dict[str, Any]], priority: int = PRIORITY_AUTOMATION
+    ) -> None:
+        """Send WebSocket commands from the HA loop without an executor hop."""
+        await self._connection.async_send(messages, priority)
+
+    async def async_select_draw_plugin(self) -> None:
+        """Switch to the plugin that shows frames sent over the WebSocket."""
+        draw_plugin = self.find_plugin(DRAW_PLUGIN_NAME)
+        if draw_plugin is None:
+            _LOGGER.warning("No %s plugin on %s; frames may not be shown", DRAW_PLUGIN_NAME, self.host)
+        elif self.get_active_plugin() != draw_plugin:
+            await self.async_send_commands([{"event": "plugin", "plugin": draw_plugin}])
+
+    async def async_start_recorder(self, path: str, minutes: float) -> None:
+        """Keep the last minutes of state changes and frames in a ring buffer file."""
+        recorder = PanelRecorder(path, minutes)
+        await self.hass.async_add_executor_job(recorder.open)
+        recorder.attach(self._connection)
+        self.recorder = recorder
+
     async def _async_update_data(self) -> dict[str, Any]:
         """Update data via WebSocket state."""
         try:
             # Return current state from WebSocket
-            with self._ws_lock:
-                current_state = dict(self._state)
+            current_state = self._connection.snapshot()
             
             # Log WebSocket connection status
             ws_status = "connected" if self.ws_connected else "disconnected"
@@ -198,7 +143,7 @@ class IkeaLedCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             raise UpdateFailed(f"Error communicating with device at {self.host}: {ex}") from ex
 
     # LED Control Methods
-    def set_brightness(self, brightness: int) -> None:
+    def set_brightness(self, brightness: int, priority: int = PRIORITY_AUTOMATION) -> None:
         """Set the brightness value (0-255)."""
         if not (0 <= brightness <= 255):
             raise ValueError("Brightness must be between 0 and 255")
@@ -206,16 +151,49 @@ class IkeaLedCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._send_ws_command({
             "event": "brightness",
             "brightness": brightness
-        })
+        }, priority)
 
-    def set_plugin(self, plugin_id: int) -> None:
+    def set_plugin(self, plugin_id: int, priority: int = PRIORITY_AUTOMATION) -> None:
         """Set the active plugin."""
         self._send_ws_command({
             "event": "plugin",
             "plugin": plugin_id
-        })
+        }, priority)
+
+    def state_messages(
+        self,
+        plugin: Optional[int] = None,
+        brightness: Optional[int] = None,
+        rotation: Optional[int] = None,
+    ) -> list[Dict[str, Any]]:
+        """Return the commands setting the given plugin, brightness and rotation."""
+        messages: list[Dict[str, Any]] = []
+        if plugin is not None:
+            messages.append({"event": "plugin", "plugin": plugin})
+        if brightness is not None:
+            if not (0 <= brightness <= 255):
+                raise ValueError("Brightness must be between 0 and 255")
+            messages.append({"event": "brightness", "brightness": brightness})
+        if rotation is not None:
+            if not (0 <= rotation < ROTATION_STEPS):
+                raise ValueError(f"Rotation must be between 0 and {ROTATION_STEPS - 1}")
+            direction, steps = self.rotation_steps(self.get_rotation(), rotation)
+            messages.extend([{"event": "rotate", "direction": direction}] * steps)
+        return messages
+
+    def apply_state(
+        self,
+        plugin: Optional[int] = None,
+        brightness: Optional[int] = None,
+        rotation: Optional[int] = None,
+        priority: int = PRIORITY_AUTOMATION,
+    ) -> None:
+        """Send plugin, brightness and rotation changes as one pipelined burst."""
+        messages = self.state_messages(plugin, brightness, rotation)
+        if messages:
+            self._send_ws_commands(messages, priority)
 
-    def set_rotation(self, direction: str) -> None:
+    def set_rotation(self, direction: str, priority: int = PRIORITY_AUTOMATION) -> None:
         """Rotate the display (direction should be 'left' or 'right')."""
         if direction not in ['left', 'right']:
             raise ValueError("Direction must be either 'left' or 'right'")
@@ -223,38 +201,100 @@ class IkeaLedCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._send_ws_command({
             "event": "rotate",
             "direction": direction
-        })
+        }, priority)
+
+    @staticmethod
+    def rotation_steps(current: int, target: int) -> tuple[str, int]:
+        """Return the shortest rotate direction and step count from current to target."""
+        delta = (target - current) % ROTATION_STEPS
+        if delta <= ROTATION_STEPS // 2:
+            return "right", delta
+        return "left", ROTATION_STEPS - delta
+
+    def set_rotation_absolute(
+        self, rotation: int, priority: int = PRIORITY_AUTOMATION
+    ) -> bool:
+        """Rotate the display to an absolute rotation (0-3) in a single burst.
+
+        Returns True once the device echoes the target rotation.
+        """
+        if not (0 <= rotation < ROTATION_STEPS):
+            raise ValueError(f"Rotation must be between 0 and {ROTATION_STEPS - 1}")
+        
+        direction, steps = self.rotation_steps(self.get_rotation(), rotation)
+        if steps == 0:
+            return True
+        
+        self._send_ws_commands(
+            [{"event": "rotate", "direction": direction}] * steps, priority
+        )
+        
+        if not self._connection.wait_for_state("rotation", rotation, ROTATION_CONFIRM_TIMEOUT):
+            _LOGGER.debug("Device did not confirm rotation %s in time", rotation)
+            return False
+        return True
+
+    def set_frame(self, pixels: list[int]) -> bool:
+        """Draw a 16x16 frame (row-major brightness values 0-255).
+
+        Frames are bulk traffic: only the pixels that changed since the last
+        frame sent are transmitted when that is smaller than the full frame,
+        and a frame still queued when a newer one arrives is dropped.
+        Returns False if the frame was dropped.
+        """
+        if len(pixels) != PANEL_PIXELS:
+            raise ValueError(f"Frame must contain {PANEL_PIXELS} pixels")
+        return self._connection.send_frame(bytes(pixels), self.supports_partial_frames)
+
+    async def async_set_frame(self, frame: bytes) -> bool:
+        """Draw a 16x16 frame from the HA loop; see set_frame."""
+        return await self._connection.async_send_frame(frame, self.supports_partial_frames)
 
     # State Access Methods
     def get_brightness(self) -> int:
         """Get the current brightness value (0-255)."""
-        with self._ws_lock:
-            return self._state["brightness"]
+        return self._connection.get("brightness")
 
     def get_rotation(self) -> int:
         """Get the current rotation value (0-3)."""
-        with self._ws_lock:
-            return self._state["rotation"]
+        return self._connection.get("rotation")
 
     def get_active_plugin(self) -> Optional[int]:
         """Get the currently active plugin ID."""
-        with self._ws_lock:
-            return self._state["plugin"]
+        return self._connection.get("plugin")
 
     def get_available_plugins(self) -> list:
         """Get list of available plugins."""
-        with self._ws_lock:
-            return self._state["plugins"]
+        return self._connection.get("plugins")
+
+    def find_plugin(self, name: str) -> Optional[int]:
+        """Get the ID of the plugin with the given name."""
+        for plugin in self.get_available_plugins():
+            if plugin.get("name") == name:
+                return plugin.get("id")
+        return None
 
     def get_schedule_state(self) -> bool:
         """Get whether the schedule is active."""
-        with self._ws_lock:
-            return self._state["scheduleActive"]
+        return self._connection.get("scheduleActive")
+
+    def get_frame(self) -> tuple[int, Optional[bytes]]:
+        """Get the last known frame and its version (bumped on every change)."""
+        return self._connection.get_frame()
+
+    @property
+    def merged_messages(self) -> int:
+        """Return how many inbound messages were merged into a queued snapshot."""
+        return self._connection.merged_messages
+
+    @property
+    def dropped_commands(self) -> int:
+        """Return how many queued outbound commands were superseded or expired."""
+        return self._connection.dropped_commands
 
     def get_schedule(self) -> list:
         """Get the current schedule."""
-        with self._ws_lock:
-            return self._state["schedule"]
+        return self._connection.get("schedule")
 
     async def async_refresh_after_command(self) -> None:
         """Refresh data after sending a command - WebSocket will handle updates automatically."""
@@ -262,6 +302,16 @@ class IkeaLedCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         await asyncio.sleep(0.1)
 
     async def async_shutdown(self) -> None:
-        """Shutdown coordinator."""
-        self.ws_connected = False
-        _LOGGER.info("Shutting down IKEA LED coordinator")
\ No newline at end of file
+        """Shutdown coordinator, releasing its share of the connection."""
+        # Runs from both the entry's on-unload callbacks and async_unload_entry
+        if self._released:
+            return
+        self._released = True
+        _LOGGER.info("Shutting down IKEA LED coordinator")
+        self.effects.async_stop()
+        self.replay.async_stop(restore=False)
+        if self.recorder is not None:
+            await self.hass.async_add_executor_job(self.recorder.close)
+        self._remove_connection_listener()
+        await async_release_connection(self.hass, self._connection)
+        await super().async_shutdown()
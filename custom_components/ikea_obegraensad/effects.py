@@ -0,0 +1,241 @@
+"""Generative effects streamed to the panel from Home Assistant."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
+
+from homeassistant.const import STATE_ON
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DEFAULT_EFFECT_FPS, PANEL_SIZE
+
+if TYPE_CHECKING:
+    from .coordinator import IkeaLedCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Precomputed sine table over one period, scaled to 0-255
+SINE_TABLE_SIZE = 256
+_SINE = (
+    127.5 + 127.5 * np.sin(np.arange(SINE_TABLE_SIZE) * 2 * math.pi / SINE_TABLE_SIZE)
+).astype(np.int32)
+
+_YS, _XS = np.mgrid[0:PANEL_SIZE, 0:PANEL_SIZE]
+
+
+class Effect(ABC):
+    """Base class for effects rendering 16x16 uint8 frames."""
+
+    name = ""
+
+    @abstractmethod
+    def render(self, elapsed: float, values: list[float]) -> np.ndarray:
+        """Return the frame at `elapsed` seconds given the source entity values."""
+
+
+class PlasmaEffect(Effect):
+    """Sine plasma whose speed follows the first source value (e.g. power in W)."""
+
+    name = "Plasma"
+
+    # Source value that doubles the base speed
+    SPEED_SCALE = 1000.0
+
+    def __init__(self) -> None:
+        """Initialize the effect."""
+        # Table phases per pixel for the three static wave components
+        self._horizontal = (_XS * 16).astype(np.int32)
+        self._diagonal = ((_XS + _YS) * 8).astype(np.int32)
+        self._radial = (np.hypot(_XS - 7.5, _YS - 7.5) * 24).astype(np.int32)
+        self._phase = 0.0
+        self._last_elapsed = 0.0
+
+    def render(self, elapsed: float, values: list[float]) -> np.ndarray:
+        """Return the next plasma frame."""
+        speed = 1.0 + (max(values[0], 0.0) / self.SPEED_SCALE if values else 0.0)
+        self._phase += (elapsed - self._last_elapsed) * 64 * speed
+        # Keep the phase within the table, so it never outgrows the int32 lookups
+        self._phase %= SINE_TABLE_SIZE
+        self._last_elapsed = elapsed
+        
+        phase = int(self._phase)
+        mask = SINE_TABLE_SIZE - 1
+        total = (
+            _SINE[(self._horizontal + phase) & mask]
+            + _SINE[(self._diagonal - phase) & mask]
+            + _SINE[(self._radial + 2 * phase) & mask]
+        )
+        return (total // 3).astype(np.uint8)
+
+
+class LifeEffect(Effect):
+    """Conway's Game of Life on a torus, reseeded when a source turns on."""
+
+    name = "Game of Life"
+
+    SEED_DENSITY = 0.3
+
+    def __init__(self) -> None:
+        """Initialize the effect."""
+        self._rng = np.random.default_rng()
+        self._cells = self._random_cells()
+        self._previous_values: list[float] = []
+
+    def _random_cells(self) -> np.ndarray:
+        return self._rng.random((PANEL_SIZE, PANEL_SIZE)) < self.SEED_DENSITY
+
+    def render(self, elapsed: float, values: list[float]) -> np.ndarray:
+        """Advance one generation and return it."""
+        triggered = any(
+            value > 0 and (index >= len(self._previous_values) or self._previous_values[index] <= 0)
+            for index, value in enumerate(values)
+        )
+        self._previous_values = values
+        if triggered or not self._cells.any():
+            self._cells |= self._random_cells()
+        
+        # 3x3 neighbourhood sum as a wrapped convolution over shifted views
+        padded = np.pad(self._cells.astype(np.uint8), 1, mode="wrap")
+        neighbours = (
+            padded[:-2, :-2] + padded[:-2, 1:-1] + padded[:-2, 2:]
+            + padded[1:-1, :-2] + padded[1:-1, 2:]
+            + padded[2:, :-2] + padded[2:, 1:-1] + padded[2:, 2:]
+        )
+        self._cells = (neighbours == 3) | (self._cells & (neighbours == 2))
+        return self._cells.astype(np.uint8) * 255
+
+
+@lru_cache(maxsize=8)
+def _interpolation_matrix(side: int) -> np.ndarray:
+    """Return the PANEL_SIZE x side matrix linearly interpolating side samples."""
+    positions = np.linspace(0, side - 1, PANEL_SIZE)
+    lower = np.floor(positions).astype(int)
+    upper = np.minimum(lower + 1, side - 1)
+    fraction = positions - lower
+    weights = np.zeros((PANEL_SIZE, side))
+    weights[np.arange(PANEL_SIZE), lower] += 1 - fraction
+    weights[np.arange(PANEL_SIZE), upper] += fraction
+    return weights
+
+
+class HeatmapEffect(Effect):
+    """Source values laid out on a grid and bilinearly interpolated to 16x16."""
+
+    name = "Heatmap"
+
+    # Smallest value range mapped to full brightness, e.g. 1 °C
+    MIN_SPAN = 1.0
+
+    def render(self, elapsed: float, values: list[float]) -> np.ndarray:
+        """Return the heatmap of the current values."""
+        if not values:
+            return np.zeros((PANEL_SIZE, PANEL_SIZE), dtype=np.uint8)
+        
+        side = math.ceil(math.sqrt(len(values)))
+        grid = np.full(side * side, np.mean(values))
+        grid[:len(values)] = values
+        grid = grid.reshape(side, side)
+        
+        low = grid.min()
+        span = max(grid.max() - low, self.MIN_SPAN)
+        weights = _interpolation_matrix(side)
+        full = weights @ grid @ weights.T
+        return ((full - low) * (255 / span)).astype(np.uint8)
+
+
+EFFECTS: dict[str, type[Effect]] = {
+    "plasma": PlasmaEffect,
+    "life": LifeEffect,
+    "heatmap": HeatmapEffect,
+}
+
+
+class EffectRunner:
+    """Stream one effect at a time to a panel through its coordinator."""
+
+    def __init__(self, hass: HomeAssistant, coordinator: IkeaLedCoordinator) -> None:
+        """Initialize the runner."""
+        self._hass = hass
+        self._coordinator = coordinator
+        self._task: Optional[asyncio.Task] = None
+        self.active: Optional[str] = None
+
+    @callback
+    def async_start(
+        self,
+        effect_id: str,
+        fps: float = DEFAULT_EFFECT_FPS,
+        source_entities: Optional[list[str]] = None,
+    ) -> None:
+        """Start streaming an effect, replacing any running one."""
+        effect = EFFECTS[effect_id]()
+        self.async_stop()
+        # The effect takes the panel over from a replay
+        self._coordinator.replay.async_stop(restore=False)
+        self.active = effect_id
+        self._task = self._hass.async_create_background_task(
+            self._async_run(effect, fps, source_entities or []),
+            f"{self._coordinator.host} effect {effect_id}",
+        )
+        self._task.add_done_callback(self._async_task_done)
+        self._coordinator.async_update_listeners()
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop the running effect, leaving its last frame on screen."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self.active is not None:
+            self.active = None
+            self._coordinator.async_update_listeners()
+
+    @callback
+    def _async_task_done(self, task: asyncio.Task) -> None:
+        """Clear the active effect when its task fails, so the select stops showing it."""
+        if task.cancelled() or task is not self._task:
+            return
+        if (ex := task.exception()) is not None:
+            _LOGGER.warning("Effect %s on %s stopped: %s", self.active, self._coordinator.host, ex)
+        self._task = None
+        self.active = None
+        self._coordinator.async_update_listeners()
+
+    def _source_value(self, entity_id: str) -> float:
+        """Return an entity state as a number; on is 1 and anything else 0."""
+        state = self._hass.states.get(entity_id)
+        if state is None:
+            return 0.0
+        try:
+            return float(state.state)
+        except ValueError:
+            return 1.0 if state.state == STATE_ON else 0.0
+
+    async def _async_run(self, effect: Effect, fps: float, source_entities: list[str]) -> None:
+        """Render and send frames at the target rate until cancelled."""
+        await self._coordinator.async_select_draw_plugin()
+        
+        loop = self._hass.loop
+        interval = 1 / fps
+        start = next_frame = loop.time()
+        while True:
+            values = [self._source_value(entity_id) for entity_id in source_entities]
+            frame = effect.render(loop.time() - start, values)
+            try:
+                await self._coordinator.async_set_frame(frame.tobytes())
+            except (ConnectionError, TimeoutError) as ex:
+                _LOGGER.debug("Dropped effect frame for %s: %s", self._coordinator.host, ex)
+            
+            next_frame += interval
+            delay = next_frame - loop.time()
+            if delay < 0:
+                # Running behind; skip the missed frames instead of bursting
+                next_frame = loop.time()
+                delay = 0
+            await asyncio.sleep(delay)
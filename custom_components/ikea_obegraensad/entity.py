@@ -0,0 +1,94 @@
+"""Base entity for IKEA OBEGRÄNSAD LED Control."""
+from __future__ import annotations
+
+import time
+from datetime import datetime
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import (
+    COMMAND_ECHO_WINDOW,
+    CONF_MIN_STATE_INTERVAL,
+    DEFAULT_MIN_STATE_INTERVAL,
+    DOMAIN,
+)
+from .coordinator import IkeaLedCoordinator
+
+
+class IkeaLedEntity(CoordinatorEntity[IkeaLedCoordinator]):
+    """Base class for IKEA OBEGRÄNSAD LED entities.
+
+    State writes caused by the device are limited to one per configured
+    interval; the last change inside an interval is written on its trailing edge.
+    """
+
+    def __init__(self, coordinator: IkeaLedCoordinator, entry: ConfigEntry) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self._entry = entry
+        self._last_state_write = 0.0
+        self._bypass_throttle_until = 0.0
+        self._unsub_trailing_write: CALLBACK_TYPE | None = None
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return device information."""
+        return DeviceInfo(
+            identifiers={(DOMAIN, self._entry.entry_id)},
+            name="IKEA OBEGRÄNSAD LED",
+            manufacturer="IKEA (Modified)",
+            model="OBEGRÄNSAD",
+            configuration_url=f"http://{self.coordinator.host}",
+        )
+
+    @property
+    def _min_state_interval(self) -> float:
+        """Return the minimum number of seconds between device-driven state writes."""
+        return self._entry.options.get(
+            CONF_MIN_STATE_INTERVAL, DEFAULT_MIN_STATE_INTERVAL
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state now, or once the current throttle interval has passed."""
+        now = time.monotonic()
+        delay = self._last_state_write + self._min_state_interval - now
+        if delay <= 0 or now < self._bypass_throttle_until:
+            self._async_write_state_now()
+            return
+        
+        if self._unsub_trailing_write is None:
+            self._unsub_trailing_write = async_call_later(
+                self.hass, delay, self._async_trailing_write
+            )
+
+    @callback
+    def _async_trailing_write(self, _now: datetime) -> None:
+        """Write the latest coordinator state at the end of a throttle interval."""
+        self._unsub_trailing_write = None
+        self._async_write_state_now()
+
+    @callback
+    def _async_write_state_now(self) -> None:
+        """Write state immediately and restart the throttle interval."""
+        if self._unsub_trailing_write is not None:
+            self._unsub_trailing_write()
+            self._unsub_trailing_write = None
+        self._last_state_write = time.monotonic()
+        self.async_write_ha_state()
+
+    @callback
+    def async_expect_command_echo(self) -> None:
+        """Let updates echoing a user command through without throttling."""
+        self._bypass_throttle_until = time.monotonic() + COMMAND_ECHO_WINDOW
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel a pending trailing write."""
+        if self._unsub_trailing_write is not None:
+            self._unsub_trailing_write()
+            self._unsub_trailing_write = None
+        await super().async_will_remove_from_hass()
@@ -0,0 +1,77 @@
+"""Frame delta encoding for IKEA OBEGRÄNSAD LED Control."""
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from .const import PANEL_PIXELS
+
+# Client-to-server WebSocket frames carry a 2 byte header plus a 4 byte mask,
+# and 2 more length bytes once the payload reaches 126 bytes.
+WS_FRAME_OVERHEAD = 6
+WS_EXTENDED_LENGTH = 126
+
+
+def ws_frame_size(payload: str) -> int:
+    """Return the number of bytes a text payload occupies on the wire."""
+    size = len(payload)
+    return size + WS_FRAME_OVERHEAD + (2 if size >= WS_EXTENDED_LENGTH else 0)
+
+
+def full_frame_message(frame: bytes) -> Dict[str, Any]:
+    """Return the message replacing the whole screen."""
+    return {"event": "screen", "data": list(frame)}
+
+
+def pixel_message(index: int, value: int) -> Dict[str, Any]:
+    """Return the message setting a single pixel."""
+    return {"event": "led", "index": index, "status": value}
+
+
+def _digits(values: np.ndarray) -> np.ndarray:
+    """Return the number of decimal digits of each value in 0-255."""
+    return 1 + (values >= 10) + (values >= 100)
+
+
+# JSON length of the message skeletons, excluding the numbers they carry
+_FULL_FRAME_BASE = len(json.dumps(full_frame_message(b""))) + 2 * (PANEL_PIXELS - 1)
+_PIXEL_MESSAGE_BASE = len(json.dumps(pixel_message(0, 0))) - 2
+
+
+def encode_frame_update(
+    previous: Optional[bytes], frame: bytes, partial: bool = True
+) -> list[Dict[str, Any]]:
+    """Return the messages that move the panel from previous to frame.
+
+    Per-pixel updates are used when the firmware supports them and they are
+    smaller on the wire than a full frame; otherwise the full frame is sent.
+    """
+    if len(frame) != PANEL_PIXELS:
+        raise ValueError(f"Frame must contain {PANEL_PIXELS} pixels")
+    
+    if previous is None or not partial:
+        return [full_frame_message(frame)]
+    
+    current = np.frombuffer(frame, dtype=np.uint8)
+    changed = np.flatnonzero(np.frombuffer(previous, dtype=np.uint8) != current)
+    if changed.size == 0:
+        return []
+    
+    full_size = _FULL_FRAME_BASE + int(_digits(current).sum()) + WS_FRAME_OVERHEAD + 2
+    partial_size = int(
+        (_PIXEL_MESSAGE_BASE + WS_FRAME_OVERHEAD + _digits(changed) + _digits(current[changed])).sum()
+    )
+    if partial_size >= full_size:
+        return [full_frame_message(frame)]
+    
+    return [
+        pixel_message(index, value)
+        for index, value in zip(changed.tolist(), current[changed].tolist())
+    ]
+
+
+def messages_size(messages: list[Dict[str, Any]]) -> int:
+    """Return the number of bytes a list of messages occupies on the wire."""
+    return sum(ws_frame_size(json.dumps(message)) for message in messages)
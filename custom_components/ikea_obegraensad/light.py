@@ -12,12 +12,11 @@ from homeassistant.components.light import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import DOMAIN, PRIORITY_INTERACTIVE
 from .coordinator import IkeaLedCoordinator
+from .entity import IkeaLedEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -33,7 +32,7 @@ async def async_setup_entry(
     async_add_entities([IkeaLedLight(coordinator, entry)])
 
 
-class IkeaLedLight(CoordinatorEntity[IkeaLedCoordinator], LightEntity):
+class IkeaLedLight(IkeaLedEntity, LightEntity):
     """Representation of an IKEA OBEGRÄNSAD LED light."""
 
     def __init__(
@@ -42,25 +41,13 @@ class IkeaLedLight(CoordinatorEntity[IkeaLedCoordinator], LightEntity):
         entry: ConfigEntry,
     ) -> None:
         """Initialize the light."""
-        super().__init__(coordinator)
-        self._entry = entry
+        super().__init__(coordinator, entry)
         self._attr_unique_id = f"{entry.entry_id}_light"
         self._attr_name = "IKEA OBEGRÄNSAD LED"
         self._attr_supported_color_modes = {ColorMode.BRIGHTNESS}
         self._attr_color_mode = ColorMode.BRIGHTNESS
         self._attr_supported_features = LightEntityFeature.TRANSITION
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            name="IKEA OBEGRÄNSAD LED",
-            manufacturer="IKEA (Modified)",
-            model="OBEGRÄNSAD",
-            configuration_url=f"http://{self.coordinator.host}",
-        )
-
     @property
     def is_on(self) -> bool:
         """Return true if light is on."""
@@ -94,15 +81,16 @@ class IkeaLedLight(CoordinatorEntity[IkeaLedCoordinator], LightEntity):
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the light."""
+        self.async_expect_command_echo()
         if ATTR_BRIGHTNESS in kwargs:
             brightness = kwargs[ATTR_BRIGHTNESS]
             await self.hass.async_add_executor_job(
-                self.coordinator.set_brightness, brightness
+                self.coordinator.set_brightness, brightness, PRIORITY_INTERACTIVE
             )
         else:
             # Turn on with max brightness
             await self.hass.async_add_executor_job(
-                self.coordinator.set_brightness, 255
+                self.coordinator.set_brightness, 255, PRIORITY_INTERACTIVE
             )
         
         # Gentle refresh to ensure UI updates
@@ -110,8 +98,9 @@ class IkeaLedLight(CoordinatorEntity[IkeaLedCoordinator], LightEntity):
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the light."""
+        self.async_expect_command_echo()
         await self.hass.async_add_executor_job(
-            self.coordinator.set_brightness, 0
+            self.coordinator.set_brightness, 0, PRIORITY_INTERACTIVE
         )
         
         # Gentle refresh to ensure UI updates  
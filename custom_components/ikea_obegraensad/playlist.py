@@ -0,0 +1,174 @@
+"""Plugin playlist scheduler for IKEA OBEGRÄNSAD LED Control."""
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_at
+
+from .const import DATA_PLAYLIST_SCHEDULER, DOMAIN, MIN_PLAYLIST_ITEM_DURATION
+from .coordinator import IkeaLedCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class PlaylistItem:
+    """A plugin shown for a fixed time, optionally at a given brightness."""
+
+    plugin: int
+    duration: float
+    brightness: Optional[int] = None
+
+
+@dataclass
+class _Playlist:
+    """A playlist running on one panel."""
+
+    coordinator: IkeaLedCoordinator
+    items: list[PlaylistItem]
+    repeat: bool
+    token: int
+    index: int = -1
+
+
+@dataclass(order=True)
+class _Event:
+    """A heap entry: when the playlist of entry_id advances next."""
+
+    when: float
+    token: int = field(compare=False)
+    entry_id: str = field(compare=False)
+
+
+class PlaylistScheduler:
+    """Advance the playlists of all panels from a single min-heap of fire times.
+
+    Only one timer is armed, for the earliest event; stale heap entries left
+    behind by skip/stop are discarded when they reach the top.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._playlists: dict[str, _Playlist] = {}
+        self._heap: list[_Event] = []
+        # Each schedule gets a fresh token, so heap entries from before a
+        # skip or restart no longer match their playlist and are ignored
+        self._tokens = itertools.count()
+        self._armed_for: Optional[float] = None
+        self._unsub_timer: Optional[CALLBACK_TYPE] = None
+
+    @callback
+    def async_start(
+        self,
+        entry_id: str,
+        coordinator: IkeaLedCoordinator,
+        items: list[PlaylistItem],
+        repeat: bool = True,
+    ) -> None:
+        """Start (or replace) the playlist of a panel with its first item."""
+        if not items:
+            raise ValueError("A playlist needs at least one item")
+        if any(item.duration < MIN_PLAYLIST_ITEM_DURATION for item in items):
+            raise ValueError(
+                f"Playlist items must be shown for at least {MIN_PLAYLIST_ITEM_DURATION} s"
+            )
+        
+        self._playlists[entry_id] = _Playlist(
+            coordinator, items, repeat, token=next(self._tokens)
+        )
+        self._advance(entry_id)
+
+    @callback
+    def async_stop(self, entry_id: str) -> None:
+        """Stop the playlist of a panel, leaving the current plugin on screen."""
+        if self._playlists.pop(entry_id, None) is not None:
+            _LOGGER.debug("Stopped playlist for %s", entry_id)
+        self._arm()
+
+    @callback
+    def async_skip(self, entry_id: str) -> None:
+        """Move the playlist of a panel to its next item now."""
+        if entry_id in self._playlists:
+            self._playlists[entry_id].token = next(self._tokens)
+            self._advance(entry_id)
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Stop all playlists and cancel the timer."""
+        self._playlists.clear()
+        self._heap.clear()
+        self._arm()
+
+    @callback
+    def _advance(self, entry_id: str) -> None:
+        """Show the next item of a playlist and schedule the one after it."""
+        playlist = self._playlists[entry_id]
+        playlist.index += 1
+        if playlist.index >= len(playlist.items):
+            if not playlist.repeat:
+                self.async_stop(entry_id)
+                return
+            playlist.index = 0
+        
+        item = playlist.items[playlist.index]
+        self._hass.async_create_task(self._async_show(playlist.coordinator, item))
+        
+        heapq.heappush(
+            self._heap,
+            _Event(self._hass.loop.time() + item.duration, playlist.token, entry_id),
+        )
+        self._arm()
+
+    async def _async_show(self, coordinator: IkeaLedCoordinator, item: PlaylistItem) -> None:
+        """Send a playlist item to its panel."""
+        # A running effect would draw over the item's plugin otherwise
+        coordinator.effects.async_stop()
+        try:
+            await self._hass.async_add_executor_job(
+                coordinator.apply_state, item.plugin, item.brightness
+            )
+        except Exception as ex:
+            _LOGGER.error("Failed to show playlist item on %s: %s", coordinator.host, ex)
+
+    @callback
+    def _arm(self) -> None:
+        """Keep a single timer armed for the earliest heap entry."""
+        when = self._heap[0].when if self._heap else None
+        if when == self._armed_for:
+            return
+        
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+        self._armed_for = when
+        if when is not None:
+            self._unsub_timer = async_call_at(self._hass, self._fire, when)
+
+    @callback
+    def _fire(self, _now: datetime) -> None:
+        """Advance every playlist whose item has run out."""
+        self._unsub_timer = None
+        self._armed_for = None
+        now = self._hass.loop.time()
+        while self._heap and self._heap[0].when <= now:
+            event = heapq.heappop(self._heap)
+            playlist = self._playlists.get(event.entry_id)
+            if playlist is not None and playlist.token == event.token:
+                self._advance(event.entry_id)
+        self._arm()
+
+
+@callback
+def async_get_scheduler(hass: HomeAssistant) -> PlaylistScheduler:
+    """Return the playlist scheduler shared by all panels."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_PLAYLIST_SCHEDULER not in domain_data:
+        domain_data[DATA_PLAYLIST_SCHEDULER] = PlaylistScheduler(hass)
+    return domain_data[DATA_PLAYLIST_SCHEDULER]
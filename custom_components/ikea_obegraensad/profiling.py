@@ -0,0 +1,137 @@
+"""Opt-in profiling for IKEA OBEGRÄNSAD LED Control."""
+from __future__ import annotations
+
+import asyncio
+import cProfile
+import json
+import logging
+import pstats
+import threading
+import time
+from contextlib import nullcontext
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, ContextManager, Iterable
+
+from homeassistant.core import HomeAssistant
+
+if TYPE_CHECKING:
+    from .connection import IkeaLedConnection
+
+_LOGGER = logging.getLogger(__name__)
+
+CLOCK_WALL = "wall"
+CLOCK_CPU = "cpu"
+
+_TIMERS = {CLOCK_WALL: time.perf_counter, CLOCK_CPU: time.thread_time}
+
+_NULL_SPAN = nullcontext()
+_enabled = False
+_spans_lock = threading.Lock()
+# name -> [count, wall seconds, cpu seconds]
+_spans: dict[str, list[float]] = {}
+
+
+class _Span:
+    """Times one pass through a code path in wall and thread CPU time."""
+
+    __slots__ = ("_name", "_wall", "_cpu")
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+
+    def __enter__(self) -> None:
+        self._wall = time.perf_counter()
+        self._cpu = time.thread_time()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        wall = time.perf_counter() - self._wall
+        cpu = time.thread_time() - self._cpu
+        with _spans_lock:
+            totals = _spans.setdefault(self._name, [0, 0.0, 0.0])
+            totals[0] += 1
+            totals[1] += wall
+            totals[2] += cpu
+
+
+def span(name: str) -> ContextManager[None]:
+    """Return a timing span for a code path; a shared no-op unless profiling."""
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name)
+
+
+async def async_profile(
+    hass: HomeAssistant,
+    connections: Iterable[IkeaLedConnection],
+    duration: float,
+    clock: str = CLOCK_WALL,
+) -> str:
+    """Profile the HA loop and the panel socket threads for `duration` seconds.
+
+    Writes a pstats file and a JSON summary of the timing spans to the config
+    directory and returns the pstats path.
+    """
+    global _enabled
+    if _enabled:
+        raise RuntimeError("A profile is already running")
+    
+    timer = _TIMERS[clock]
+    loop_profiler = cProfile.Profile(timer)
+    thread_profilers = {
+        connection: cProfile.Profile(timer) for connection in connections
+    }
+    with _spans_lock:
+        _spans.clear()
+    
+    _enabled = True
+    loop_profiler.enable()
+    await asyncio.gather(
+        *(
+            connection.async_run_in_thread(profiler.enable)
+            for connection, profiler in thread_profilers.items()
+        ),
+        return_exceptions=True,
+    )
+    try:
+        await asyncio.sleep(duration)
+    finally:
+        await asyncio.gather(
+            *(
+                connection.async_run_in_thread(profiler.disable)
+                for connection, profiler in thread_profilers.items()
+            ),
+            return_exceptions=True,
+        )
+        loop_profiler.disable()
+        _enabled = False
+    
+    with _spans_lock:
+        spans = {
+            name: {
+                "count": int(count),
+                "wall_total_ms": wall * 1000,
+                "cpu_total_ms": cpu * 1000,
+                "wall_mean_us": wall / count * 1e6,
+                "cpu_mean_us": cpu / count * 1e6,
+            }
+            for name, (count, wall, cpu) in _spans.items()
+        }
+    
+    base = hass.config.path(
+        f"ikea_obegraensad_profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    )
+    
+    def write_results() -> None:
+        stats = pstats.Stats(loop_profiler)
+        for profiler in thread_profilers.values():
+            # A socket thread that never ran while profiling has no stats
+            profiler.create_stats()
+            if profiler.stats:
+                stats.add(profiler)
+        stats.dump_stats(f"{base}.prof")
+        with open(f"{base}_spans.json", "w", encoding="utf-8") as file:
+            json.dump({"clock": clock, "duration": duration, "spans": spans}, file, indent=2)
+    
+    await hass.async_add_executor_job(write_results)
+    _LOGGER.info("Wrote profile to %s.prof and %s_spans.json", base, base)
+    return f"{base}.prof"
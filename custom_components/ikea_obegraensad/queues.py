@@ -0,0 +1,143 @@
+"""Message queues for IKEA OBEGRÄNSAD LED Control."""
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+
+class SnapshotQueue:
+    """Bounded FIFO of state snapshots for a single consumer.
+
+    When the queue is full a new snapshot is merged field-wise into the newest
+    queued one instead of growing the queue, so a slow consumer skips
+    intermediate states but always ends up with the latest value of every field.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """Initialize the queue."""
+        self._maxsize = maxsize
+        self._items: deque[Dict[str, Any]] = deque()
+        self._not_empty = asyncio.Event()
+        self.merged = 0
+
+    def __len__(self) -> int:
+        """Return the number of queued snapshots."""
+        return len(self._items)
+
+    def put(self, snapshot: Dict[str, Any]) -> None:
+        """Queue a snapshot, merging it into the newest one when full."""
+        if len(self._items) >= self._maxsize:
+            self._items[-1].update(snapshot)
+            self.merged += 1
+        else:
+            self._items.append(snapshot)
+        self._not_empty.set()
+
+    def get_nowait(self) -> Dict[str, Any]:
+        """Return the oldest snapshot; raise IndexError if the queue is empty."""
+        snapshot = self._items.popleft()
+        if not self._items:
+            self._not_empty.clear()
+        return snapshot
+
+    async def get(self) -> Dict[str, Any]:
+        """Wait for and return the oldest snapshot."""
+        while not self._items:
+            await self._not_empty.wait()
+        return self.get_nowait()
+
+
+@dataclass(order=True)
+class _Command:
+    """A queued outbound command."""
+
+    priority: int
+    sequence: int
+    build: Callable[[], list[Dict[str, Any]]] = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+    key: Optional[str] = field(compare=False, default=None)
+    expires: Optional[float] = field(compare=False, default=None)
+
+
+class PriorityCommandQueue:
+    """Outbound commands ordered by priority, then by arrival.
+
+    Commands queued with a key are droppable: a newer command with the same
+    key replaces a queued one. Commands with a time to live are dropped once
+    stale. Dropped commands resolve their future with False.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the queue."""
+        self._heap: list[_Command] = []
+        self._keyed: dict[str, _Command] = {}
+        self._sequence = itertools.count()
+        self._not_empty = asyncio.Event()
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        """Return the number of queued commands, including superseded ones."""
+        return len(self._heap)
+
+    def put(
+        self,
+        build: Callable[[], list[Dict[str, Any]]],
+        priority: int,
+        key: Optional[str] = None,
+        ttl: Optional[float] = None,
+    ) -> asyncio.Future:
+        """Queue a command; return a future resolving to True once it is sent.
+
+        `build` is called right before sending and returns the messages.
+        """
+        future = asyncio.get_running_loop().create_future()
+        command = _Command(
+            priority,
+            next(self._sequence),
+            build,
+            future,
+            key,
+            time.monotonic() + ttl if ttl is not None else None,
+        )
+        if key is not None:
+            if (previous := self._keyed.get(key)) is not None:
+                self._drop(previous)
+            self._keyed[key] = command
+        heapq.heappush(self._heap, command)
+        self._not_empty.set()
+        return future
+
+    def clear(self) -> None:
+        """Drop every queued command."""
+        for command in self._heap:
+            self._drop(command)
+        self._heap.clear()
+        self._keyed.clear()
+
+    def _drop(self, command: _Command) -> None:
+        """Resolve a command as not sent."""
+        if not command.future.done():
+            command.future.set_result(False)
+            self.dropped += 1
+
+    async def get(self) -> _Command:
+        """Wait for and return the most urgent live command."""
+        while True:
+            while not self._heap:
+                self._not_empty.clear()
+                await self._not_empty.wait()
+            command = heapq.heappop(self._heap)
+            if command.key is not None and self._keyed.get(command.key) is command:
+                del self._keyed[command.key]
+            if command.future.done():
+                # Superseded or cancelled by the caller
+                continue
+            if command.expires is not None and time.monotonic() > command.expires:
+                self._drop(command)
+                continue
+            return command
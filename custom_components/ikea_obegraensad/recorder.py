@@ -0,0 +1,350 @@
+"""Ring-buffer recorder of panel state and frames, with replay."""
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import mmap
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+
+import numpy as np
+
+from homeassistant.core import HomeAssistant, callback
+
+from .connection import FRAME, IkeaLedConnection
+from .const import (
+    PANEL_PIXELS,
+    RECORDER_FRAME_INTERVAL,
+    RECORDER_STATE_RATE,
+    REPLAY_TARGET_PANEL,
+)
+
+if TYPE_CHECKING:
+    from .coordinator import IkeaLedCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Recorded state fields; a field's id in the file is its index
+FIELDS = ("plugin", "brightness", "rotation", "scheduleActive")
+_FIELD_IDS = {name: field_id for field_id, name in enumerate(FIELDS)}
+NO_VALUE = -1  # Stored for a field the panel has not reported
+
+MAGIC = b"OBGR"
+FORMAT_VERSION = 1
+
+# The file is a header followed by a ring of state records and a ring of frame records
+HEADER_DTYPE = np.dtype(
+    [
+        ("magic", "S4"),
+        ("version", "<u4"),
+        ("state_slots", "<u4"),
+        ("frame_slots", "<u4"),
+        ("state_head", "<u8"),  # Records ever written; the next slot is head % slots
+        ("frame_head", "<u8"),
+    ]
+)
+STATE_DTYPE = np.dtype(
+    {
+        "names": ["timestamp", "field", "value"],
+        "formats": ["<f8", "u1", "<i4"],
+        "offsets": [0, 8, 12],
+        "itemsize": 16,
+    }
+)
+FRAME_DTYPE = np.dtype([("timestamp", "<f8"), ("frame", "u1", (PANEL_PIXELS,))])
+
+# A recorded event: wall-clock timestamp, field name (or FRAME) and value
+RecordedEvent = tuple[float, str, Any]
+
+
+class PanelRecorder:
+    """Fixed-size, memory-mapped ring buffer of a panel's state changes and frames.
+
+    The oldest records are overwritten, so the file size and memory use stay
+    constant whatever the message rate. Frames are recorded at most once per
+    RECORDER_FRAME_INTERVAL; a frame replaced within the interval is only kept
+    if nothing replaced it before the interval was over.
+    """
+
+    def __init__(self, path: str, minutes: float) -> None:
+        """Initialize the recorder for a history of roughly `minutes`."""
+        self.path = path
+        seconds = minutes * 60
+        self._state_slots = max(1, int(seconds * RECORDER_STATE_RATE))
+        # A held-back frame and the frame replacing it are written together
+        self._frame_slots = max(1, int(2 * seconds / RECORDER_FRAME_INTERVAL))
+        self._lock = threading.Lock()
+        self._mmap: Optional[mmap.mmap] = None
+        self._header: Optional[np.ndarray] = None
+        self._states: Optional[np.ndarray] = None
+        self._frames: Optional[np.ndarray] = None
+        self._last_frame_time = 0.0
+        self._pending_frame: Optional[tuple[float, bytes]] = None
+        self._remove_listener: Optional[Callable[[], None]] = None
+
+    @property
+    def size(self) -> int:
+        """Return the size of the file in bytes."""
+        return (
+            HEADER_DTYPE.itemsize
+            + self._state_slots * STATE_DTYPE.itemsize
+            + self._frame_slots * FRAME_DTYPE.itemsize
+        )
+
+    def open(self) -> None:
+        """Map the file, keeping its records if it was written with the same size."""
+        size = self.size
+        with open(self.path, "r+b" if os.path.exists(self.path) else "w+b") as file:
+            if os.fstat(file.fileno()).st_size != size:
+                file.truncate(size)
+            self._mmap = mmap.mmap(file.fileno(), size)
+
+        header = np.ndarray((), HEADER_DTYPE, self._mmap)
+        if (
+            header["magic"] != MAGIC
+            or header["version"] != FORMAT_VERSION
+            or header["state_slots"] != self._state_slots
+            or header["frame_slots"] != self._frame_slots
+        ):
+            _LOGGER.debug("Starting a new recording in %s", self.path)
+            header[()] = (MAGIC, FORMAT_VERSION, self._state_slots, self._frame_slots, 0, 0)
+
+        states_offset = HEADER_DTYPE.itemsize
+        frames_offset = states_offset + self._state_slots * STATE_DTYPE.itemsize
+        self._header = header
+        self._states = np.ndarray((self._state_slots,), STATE_DTYPE, self._mmap, states_offset)
+        self._frames = np.ndarray((self._frame_slots,), FRAME_DTYPE, self._mmap, frames_offset)
+
+    def attach(self, connection: IkeaLedConnection) -> None:
+        """Record the connection's current state, then every change it reports."""
+        self._remove_listener = connection.add_listener(self._handle_changes)
+        changes: Dict[str, Any] = connection.snapshot()
+        _, changes[FRAME] = connection.get_frame()
+        self._handle_changes(changes)
+
+    def _handle_changes(self, changes: Dict[str, Any]) -> None:
+        """Record changed fields; runs in the socket thread."""
+        now = time.time()
+        with self._lock:
+            if self._mmap is None:
+                return
+            for name, value in changes.items():
+                if name == FRAME:
+                    if value is not None:
+                        self._record_frame(now, value)
+                elif name in _FIELD_IDS:
+                    self._write_state(now, name, value)
+
+    def _write_state(self, timestamp: float, name: str, value: Any) -> None:
+        """Append a state record; must be called with the lock held."""
+        try:
+            encoded = NO_VALUE if value is None else int(value)
+        except (TypeError, ValueError):
+            return
+        head = int(self._header["state_head"])
+        self._states[head % self._state_slots] = (timestamp, _FIELD_IDS[name], encoded)
+        self._header["state_head"] = head + 1
+
+    def _record_frame(self, timestamp: float, frame: bytes) -> None:
+        """Record a frame, holding it back if the last one was recorded too recently."""
+        if timestamp - self._last_frame_time < RECORDER_FRAME_INTERVAL:
+            self._pending_frame = (timestamp, frame)
+            return
+        # The held-back frame stayed on screen until now
+        self._flush_pending_frame()
+        self._write_frame(timestamp, frame)
+        self._last_frame_time = timestamp
+
+    def _flush_pending_frame(self) -> None:
+        """Write the held-back frame, if any; must be called with the lock held."""
+        if self._pending_frame is not None:
+            self._write_frame(*self._pending_frame)
+            self._pending_frame = None
+
+    def _write_frame(self, timestamp: float, frame: bytes) -> None:
+        """Append a frame record; must be called with the lock held."""
+        head = int(self._header["frame_head"])
+        record = self._frames[head % self._frame_slots]
+        record["timestamp"] = timestamp
+        record["frame"] = np.frombuffer(frame, np.uint8)
+        self._header["frame_head"] = head + 1
+
+    def read(self, start: float, end: float) -> list[RecordedEvent]:
+        """Return the events between two timestamps, oldest first.
+
+        The values in effect at `start` are included, stamped with `start`.
+        """
+        with self._lock:
+            if self._mmap is None:
+                raise RuntimeError("Recorder is closed")
+            self._flush_pending_frame()
+            states = self._states[: min(int(self._header["state_head"]), self._state_slots)]
+            frames = self._frames[: min(int(self._header["frame_head"]), self._frame_slots)]
+
+            events: list[RecordedEvent] = []
+            state_times = states["timestamp"]
+            for field_id, name in enumerate(FIELDS):
+                if (index := _latest_before(state_times, states["field"] == field_id, start)) is not None:
+                    events.append((start, name, _decode(states["value"][index])))
+            if (index := _latest_before(frames["timestamp"], True, start)) is not None:
+                events.append((start, FRAME, frames["frame"][index].tobytes()))
+
+            for timestamp, field_id, value in states[(state_times >= start) & (state_times <= end)]:
+                events.append((float(timestamp), FIELDS[field_id], _decode(value)))
+            frame_times = frames["timestamp"]
+            for timestamp, frame in frames[(frame_times >= start) & (frame_times <= end)]:
+                events.append((float(timestamp), FRAME, frame.tobytes()))
+
+        events.sort(key=lambda event: event[0])
+        return events
+
+    def close(self) -> None:
+        """Stop recording and unmap the file."""
+        if self._remove_listener is not None:
+            self._remove_listener()
+            self._remove_listener = None
+        with self._lock:
+            if self._mmap is None:
+                return
+            self._flush_pending_frame()
+            # Drop the views first; the map cannot close while they exist
+            self._header = self._states = self._frames = None
+            self._mmap.flush()
+            self._mmap.close()
+            self._mmap = None
+
+
+def _latest_before(times: np.ndarray, mask: Any, start: float) -> Optional[int]:
+    """Return the index of the newest record before `start` selected by `mask`."""
+    candidates = np.flatnonzero(mask & (times < start))
+    if not candidates.size:
+        return None
+    return int(candidates[np.argmax(times[candidates])])
+
+
+def _decode(value: Any) -> Optional[int]:
+    """Return a stored state value, or None if the panel had not reported it."""
+    value = int(value)
+    return None if value == NO_VALUE else value
+
+
+class ReplayRunner:
+    """Play recorded events back to the panel or the preview camera.
+
+    A replay to the panel snapshots it first and restores it when the replay
+    ends or is stopped, unless whatever stopped it has taken the panel over.
+    """
+
+    _runs = itertools.count()
+
+    def __init__(self, hass: HomeAssistant, coordinator: IkeaLedCoordinator) -> None:
+        """Initialize the runner."""
+        self._hass = hass
+        self._coordinator = coordinator
+        self._task: Optional[asyncio.Task] = None
+        self._snapshot: Optional[str] = None
+        self._preview_frame: Optional[bytes] = None
+        self._preview_version = 0
+        self._rotation: Optional[int] = None
+
+    def get_frame(self) -> tuple[int, Optional[bytes]]:
+        """Return the frame replayed to the preview and its version, if replaying."""
+        return self._preview_version, self._preview_frame
+
+    @callback
+    def async_start(
+        self, events: list[RecordedEvent], start: float, speed: float, target: str
+    ) -> None:
+        """Replay events recorded from `start` on, replacing any running replay."""
+        self.async_stop()
+        to_panel = target == REPLAY_TARGET_PANEL
+        if to_panel:
+            self._coordinator.effects.async_stop()
+            self._snapshot = f"replay {next(self._runs)}"
+            self._coordinator.snapshots.async_snapshot(self._snapshot)
+        self._task = self._hass.async_create_background_task(
+            self._async_run(events, start, speed, to_panel),
+            f"{self._coordinator.host} replay",
+        )
+
+    @callback
+    def async_stop(self, restore: bool = True) -> None:
+        """Stop the running replay; without restore the panel is left as it is."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._async_release_panel(restore)
+
+    @callback
+    def _async_release_panel(self, restore: bool) -> None:
+        """Restore or forget the snapshot taken before a replay to the panel."""
+        if self._snapshot is None:
+            return
+        name, self._snapshot = self._snapshot, None
+        if restore:
+            self._hass.async_create_background_task(
+                self._async_restore(name), f"{self._coordinator.host} replay restore"
+            )
+        else:
+            self._coordinator.snapshots.async_discard(name)
+
+    async def _async_restore(self, name: str) -> None:
+        """Put the panel back as it was before the replay."""
+        try:
+            await self._coordinator.snapshots.async_restore(name)
+        except (ConnectionError, KeyError) as ex:
+            _LOGGER.debug("Could not restore %s after replay: %s", self._coordinator.host, ex)
+
+    async def _async_run(
+        self, events: list[RecordedEvent], start: float, speed: float, to_panel: bool
+    ) -> None:
+        """Show each event at its recorded time, scaled by speed."""
+        loop = self._hass.loop
+        began = loop.time()
+        self._rotation = self._coordinator.get_rotation()
+        restore = True
+        try:
+            if to_panel and any(field == FRAME for _, field, _ in events):
+                await self._coordinator.async_select_draw_plugin()
+            for timestamp, field, value in events:
+                delay = began + (timestamp - start) / speed - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                if to_panel:
+                    await self._async_show_on_panel(field, value)
+                elif field == FRAME:
+                    self._preview_frame = value
+                    self._preview_version += 1
+        except asyncio.CancelledError:
+            # Cancelled along with Home Assistant's tasks; leave the panel as it is
+            restore = False
+            raise
+        except Exception as ex:
+            _LOGGER.warning("Replay to %s stopped: %s", self._coordinator.host, ex)
+        finally:
+            self._preview_frame = None
+            self._preview_version += 1
+            # async_stop clears or replaces the task and releases the panel itself
+            if self._task is asyncio.current_task():
+                self._task = None
+                self._async_release_panel(restore)
+
+    async def _async_show_on_panel(self, field: str, value: Any) -> None:
+        """Send one recorded event to the panel."""
+        coordinator = self._coordinator
+        if field == FRAME:
+            await coordinator.async_set_frame(value)
+        elif field == "brightness" and value is not None:
+            if value != coordinator.get_brightness():
+                await coordinator.async_send_commands(coordinator.state_messages(brightness=value))
+        elif field == "rotation" and value is not None and value != self._rotation:
+            # The cached rotation lags behind rotations still in flight at high speed
+            direction, steps = coordinator.rotation_steps(self._rotation, value)
+            self._rotation = value
+            await coordinator.async_send_commands(
+                [{"event": "rotate", "direction": direction}] * steps
+            )
+        # Frames are drawn through the Draw plugin, so recorded plugins are not replayed
@@ -7,15 +7,21 @@ from typing import Any
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import DOMAIN, EFFECT_OPTION_PREFIX, PRIORITY_INTERACTIVE, ROTATION_STEPS
 from .coordinator import IkeaLedCoordinator
+from .effects import EFFECTS
+from .entity import IkeaLedEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+# Effects streamed from Home Assistant, offered as virtual plugins
+EFFECT_OPTIONS = {
+    f"{EFFECT_OPTION_PREFIX}{effect.name}": effect_id
+    for effect_id, effect in EFFECTS.items()
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -25,10 +31,13 @@ async def async_setup_entry(
     """Set up the IKEA OBEGRÄNSAD LED select platform."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
     
-    async_add_entities([IkeaLedPluginSelect(coordinator, entry)])
+    async_add_entities([
+        IkeaLedPluginSelect(coordinator, entry),
+        IkeaLedRotationSelect(coordinator, entry),
+    ])
 
 
-class IkeaLedPluginSelect(CoordinatorEntity[IkeaLedCoordinator], SelectEntity):
+class IkeaLedPluginSelect(IkeaLedEntity, SelectEntity):
     """Representation of an IKEA OBEGRÄNSAD LED plugin selector."""
 
     def __init__(
@@ -37,37 +46,28 @@ class IkeaLedPluginSelect(CoordinatorEntity[IkeaLedCoordinator], SelectEntity):
         entry: ConfigEntry,
     ) -> None:
         """Initialize the select entity."""
-        super().__init__(coordinator)
-        self._entry = entry
+        super().__init__(coordinator, entry)
         self._attr_unique_id = f"{entry.entry_id}_plugin_select"
         self._attr_name = "IKEA OBEGRÄNSAD Plugin"
         self._attr_icon = "mdi:format-list-bulleted"
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            name="IKEA OBEGRÄNSAD LED",
-            manufacturer="IKEA (Modified)",
-            model="OBEGRÄNSAD",
-            configuration_url=f"http://{self.coordinator.host}",
-        )
-
     @property
     def options(self) -> list[str]:
         """Return a list of selectable options."""
         if not self.coordinator.data or "plugins" not in self.coordinator.data:
-            return []
+            return list(EFFECT_OPTIONS)
         
         return [
             f"{plugin.get('id')}: {plugin.get('name', 'Unknown')}"
             for plugin in self.coordinator.data["plugins"]
-        ]
+        ] + list(EFFECT_OPTIONS)
 
     @property
     def current_option(self) -> str | None:
         """Return the current selected option."""
+        if (effect_id := self.coordinator.effects.active) is not None:
+            return f"{EFFECT_OPTION_PREFIX}{EFFECTS[effect_id].name}"
+        
         if not self.coordinator.data:
             return None
             
@@ -85,12 +85,18 @@ class IkeaLedPluginSelect(CoordinatorEntity[IkeaLedCoordinator], SelectEntity):
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
+        if option in EFFECT_OPTIONS:
+            self.coordinator.effects.async_start(EFFECT_OPTIONS[option])
+            return
+        
         # Extract plugin ID from the option string (format: "ID: Name")
         try:
             plugin_id = int(option.split(":")[0].strip())
             
+            self.coordinator.effects.async_stop()
+            self.coordinator.replay.async_stop(restore=False)
             await self.hass.async_add_executor_job(
-                self.coordinator.set_plugin, plugin_id
+                self.coordinator.set_plugin, plugin_id, PRIORITY_INTERACTIVE
             )
             
             # Gentle refresh to ensure UI updates
@@ -99,4 +105,50 @@ class IkeaLedPluginSelect(CoordinatorEntity[IkeaLedCoordinator], SelectEntity):
         except (ValueError, IndexError) as ex:
             _LOGGER.error("Failed to parse plugin ID from option: %s", option)
         except Exception as ex:
-            _LOGGER.error("Failed to set plugin: %s", ex)
\ No newline at end of file
+            _LOGGER.error("Failed to set plugin: %s", ex)
+
+
+class IkeaLedRotationSelect(IkeaLedEntity, SelectEntity):
+    """Representation of an IKEA OBEGRÄNSAD LED absolute rotation selector."""
+
+    def __init__(
+        self,
+        coordinator: IkeaLedCoordinator,
+        entry: ConfigEntry,
+    ) -> None:
+        """Initialize the select entity."""
+        super().__init__(coordinator, entry)
+        self._attr_unique_id = f"{entry.entry_id}_rotation_select"
+        self._attr_name = "IKEA OBEGRÄNSAD Rotation"
+        self._attr_icon = "mdi:screen-rotation"
+        self._attr_options = [f"{90 * step}°" for step in range(ROTATION_STEPS)]
+
+    @property
+    def current_option(self) -> str | None:
+        """Return the current selected option."""
+        if not self.coordinator.data:
+            return None
+        
+        rotation = self.coordinator.data.get("rotation")
+        if rotation is None:
+            return None
+        return self._attr_options[rotation % ROTATION_STEPS]
+
+    async def async_select_option(self, option: str) -> None:
+        """Rotate the display to the selected orientation."""
+        try:
+            rotation = self._attr_options.index(option)
+            
+            confirmed = await self.hass.async_add_executor_job(
+                self.coordinator.set_rotation_absolute, rotation, PRIORITY_INTERACTIVE
+            )
+            if not confirmed:
+                _LOGGER.warning("Rotation to %s was not confirmed by the device", option)
+            
+            # Gentle refresh to ensure UI updates
+            await self.coordinator.async_refresh_after_command()
+            
+        except ValueError:
+            _LOGGER.error("Invalid rotation option: %s", option)
+        except Exception as ex:
+            _LOGGER.error("Failed to set rotation: %s", ex)
@@ -10,13 +10,13 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import IkeaLedCoordinator
+from .entity import IkeaLedEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -34,12 +34,13 @@ async def async_setup_entry(
         IkeaLedActivePluginSensor(coordinator, entry),
         IkeaLedScheduleStatusSensor(coordinator, entry),
         IkeaLedBrightnessSensor(coordinator, entry),
+        IkeaLedMergedMessagesSensor(coordinator, entry),
     ]
     
     async_add_entities(sensors)
 
 
-class IkeaLedBaseSensor(CoordinatorEntity[IkeaLedCoordinator], SensorEntity):
+class IkeaLedBaseSensor(IkeaLedEntity, SensorEntity):
     """Base class for IKEA OBEGRÄNSAD LED sensors."""
 
     def __init__(
@@ -51,25 +52,13 @@ class IkeaLedBaseSensor(CoordinatorEntity[IkeaLedCoordinator], SensorEntity):
         icon: str | None = None,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._entry = entry
+        super().__init__(coordinator, entry)
         self._sensor_type = sensor_type
         self._attr_unique_id = f"{entry.entry_id}_{sensor_type}"
         self._attr_name = f"IKEA OBEGRÄNSAD {name}"
         if icon:
             self._attr_icon = icon
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            name="IKEA OBEGRÄNSAD LED",
-            manufacturer="IKEA (Modified)",
-            model="OBEGRÄNSAD",
-            configuration_url=f"http://{self.coordinator.host}",
-        )
-
 
 class IkeaLedRotationSensor(IkeaLedBaseSensor):
     """Sensor for current rotation value."""
@@ -216,4 +205,26 @@ class IkeaLedBrightnessSensor(IkeaLedBaseSensor):
         return {
             "brightness_percent": round((brightness / 255) * 100, 1),
             "brightness_raw": brightness,
-        }
\ No newline at end of file
+        }
+
+
+class IkeaLedMergedMessagesSensor(IkeaLedBaseSensor):
+    """Diagnostic sensor counting inbound messages merged under load."""
+
+    def __init__(self, coordinator: IkeaLedCoordinator, entry: ConfigEntry) -> None:
+        """Initialize the merged messages sensor."""
+        super().__init__(
+            coordinator,
+            entry,
+            "merged_messages",
+            "Merged Messages",
+            "mdi:call-merge"
+        )
+        self._attr_state_class = SensorStateClass.TOTAL_INCREASING
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        self._attr_entity_registry_enabled_default = False
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of merged inbound messages."""
+        return self.coordinator.merged_messages
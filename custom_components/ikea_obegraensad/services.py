@@ -0,0 +1,273 @@
+"""Services for IKEA OBEGRÄNSAD LED Control."""
+from __future__ import annotations
+
+import asyncio
+import logging
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import device_registry as dr
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    ATTR_BRIGHTNESS,
+    ATTR_CLOCK,
+    ATTR_DEVICE_ID,
+    ATTR_DURATION,
+    ATTR_EFFECT,
+    ATTR_END,
+    ATTR_FPS,
+    ATTR_ITEMS,
+    ATTR_NAME,
+    ATTR_PLUGIN,
+    ATTR_REPEAT,
+    ATTR_SOURCE_ENTITIES,
+    ATTR_SPEED,
+    ATTR_START,
+    ATTR_TARGET,
+    DATA_CONNECTIONS,
+    DEFAULT_EFFECT_FPS,
+    DEFAULT_PROFILE_DURATION,
+    DOMAIN,
+    MAX_EFFECT_FPS,
+    MAX_PROFILE_DURATION,
+    MAX_REPLAY_SPEED,
+    MIN_PLAYLIST_ITEM_DURATION,
+    REPLAY_TARGET_PANEL,
+    REPLAY_TARGET_PREVIEW,
+    SERVICE_PROFILE,
+    SERVICE_REPLAY,
+    SERVICE_RESTORE,
+    SERVICE_SNAPSHOT,
+    SERVICE_SKIP_PLAYLIST,
+    SERVICE_START_EFFECT,
+    SERVICE_START_PLAYLIST,
+    SERVICE_STOP_EFFECT,
+    SERVICE_STOP_PLAYLIST,
+    SERVICE_STOP_REPLAY,
+)
+from .coordinator import IkeaLedCoordinator
+from .effects import EFFECTS
+from .playlist import PlaylistItem, async_get_scheduler
+from .profiling import CLOCK_CPU, CLOCK_WALL, async_profile
+
+_LOGGER = logging.getLogger(__name__)
+
+DEVICE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): vol.All(cv.ensure_list, [cv.string]),
+    }
+)
+
+PLAYLIST_ITEM_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_PLUGIN): vol.Coerce(int),
+        vol.Required(ATTR_DURATION): vol.All(
+            cv.time_period,
+            lambda value: value.total_seconds(),
+            vol.Range(min=MIN_PLAYLIST_ITEM_DURATION),
+        ),
+        vol.Optional(ATTR_BRIGHTNESS): vol.All(vol.Coerce(int), vol.Range(min=0, max=255)),
+    }
+)
+
+START_PLAYLIST_SCHEMA = DEVICE_SCHEMA.extend(
+    {
+        vol.Required(ATTR_ITEMS): vol.All(cv.ensure_list, [PLAYLIST_ITEM_SCHEMA], vol.Length(min=1)),
+        vol.Optional(ATTR_REPEAT, default=True): cv.boolean,
+    }
+)
+
+START_EFFECT_SCHEMA = DEVICE_SCHEMA.extend(
+    {
+        vol.Required(ATTR_EFFECT): vol.In(list(EFFECTS)),
+        vol.Optional(ATTR_FPS, default=DEFAULT_EFFECT_FPS): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=MAX_EFFECT_FPS)
+        ),
+        vol.Optional(ATTR_SOURCE_ENTITIES, default=[]): cv.entity_ids,
+    }
+)
+
+SNAPSHOT_SCHEMA = DEVICE_SCHEMA.extend(
+    {
+        vol.Optional(ATTR_NAME): cv.string,
+    }
+)
+
+REPLAY_SCHEMA = DEVICE_SCHEMA.extend(
+    {
+        vol.Required(ATTR_START): cv.datetime,
+        vol.Optional(ATTR_END): cv.datetime,
+        vol.Optional(ATTR_SPEED, default=1): vol.All(
+            vol.Coerce(float), vol.Range(min=0.1, max=MAX_REPLAY_SPEED)
+        ),
+        vol.Optional(ATTR_TARGET, default=REPLAY_TARGET_PREVIEW): vol.In(
+            [REPLAY_TARGET_PREVIEW, REPLAY_TARGET_PANEL]
+        ),
+    }
+)
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_DURATION, default=DEFAULT_PROFILE_DURATION): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=MAX_PROFILE_DURATION)
+        ),
+        vol.Optional(ATTR_CLOCK, default=CLOCK_WALL): vol.In([CLOCK_WALL, CLOCK_CPU]),
+    }
+)
+
+
+@callback
+def _async_get_coordinators(
+    hass: HomeAssistant, call: ServiceCall
+) -> dict[str, IkeaLedCoordinator]:
+    """Return the coordinators of the devices targeted by a service call, by entry id."""
+    device_registry = dr.async_get(hass)
+    coordinators: dict[str, IkeaLedCoordinator] = {}
+    for device_id in call.data[ATTR_DEVICE_ID]:
+        device = device_registry.async_get(device_id)
+        if device is None:
+            raise HomeAssistantError(f"Unknown device: {device_id}")
+        
+        for entry_id in device.config_entries:
+            coordinator = hass.data.get(DOMAIN, {}).get(entry_id)
+            if isinstance(coordinator, IkeaLedCoordinator):
+                coordinators[entry_id] = coordinator
+                break
+        else:
+            raise HomeAssistantError(f"Device {device_id} is not a loaded IKEA OBEGRÄNSAD LED")
+    return coordinators
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration's services."""
+
+    @callback
+    def async_start_playlist(call: ServiceCall) -> None:
+        """Start a playlist on the targeted panels."""
+        items = [
+            PlaylistItem(
+                plugin=item[ATTR_PLUGIN],
+                duration=item[ATTR_DURATION],
+                brightness=item.get(ATTR_BRIGHTNESS),
+            )
+            for item in call.data[ATTR_ITEMS]
+        ]
+        scheduler = async_get_scheduler(hass)
+        for entry_id, coordinator in _async_get_coordinators(hass, call).items():
+            scheduler.async_start(entry_id, coordinator, items, call.data[ATTR_REPEAT])
+
+    @callback
+    def async_stop_playlist(call: ServiceCall) -> None:
+        """Stop the playlist on the targeted panels."""
+        scheduler = async_get_scheduler(hass)
+        for entry_id in _async_get_coordinators(hass, call):
+            scheduler.async_stop(entry_id)
+
+    @callback
+    def async_skip_playlist(call: ServiceCall) -> None:
+        """Skip to the next playlist item on the targeted panels."""
+        scheduler = async_get_scheduler(hass)
+        for entry_id in _async_get_coordinators(hass, call):
+            scheduler.async_skip(entry_id)
+
+    @callback
+    def async_start_effect(call: ServiceCall) -> None:
+        """Stream an effect to the targeted panels."""
+        for coordinator in _async_get_coordinators(hass, call).values():
+            coordinator.effects.async_start(
+                call.data[ATTR_EFFECT], call.data[ATTR_FPS], call.data[ATTR_SOURCE_ENTITIES]
+            )
+
+    @callback
+    def async_stop_effect(call: ServiceCall) -> None:
+        """Stop the effect on the targeted panels."""
+        for coordinator in _async_get_coordinators(hass, call).values():
+            coordinator.effects.async_stop()
+
+    @callback
+    def async_snapshot(call: ServiceCall) -> None:
+        """Save the state of the targeted panels."""
+        for coordinator in _async_get_coordinators(hass, call).values():
+            coordinator.snapshots.async_snapshot(call.data.get(ATTR_NAME))
+
+    async def async_restore(call: ServiceCall) -> None:
+        """Put the targeted panels back to their latest (or the named) snapshot."""
+        name = call.data.get(ATTR_NAME)
+        coordinators = _async_get_coordinators(hass, call).values()
+        try:
+            await asyncio.gather(
+                *(coordinator.snapshots.async_restore(name) for coordinator in coordinators)
+            )
+        except KeyError as ex:
+            raise HomeAssistantError(f"No snapshot to restore: {name or 'latest'}") from ex
+        except ConnectionError as ex:
+            raise HomeAssistantError(str(ex)) from ex
+
+    async def async_replay(call: ServiceCall) -> None:
+        """Play recorded history back to the targeted panels or their previews."""
+        start = dt_util.as_timestamp(call.data[ATTR_START])
+        end = dt_util.as_timestamp(call.data.get(ATTR_END, dt_util.utcnow()))
+        if end <= start:
+            raise HomeAssistantError("The replay must end after it starts")
+        
+        for coordinator in _async_get_coordinators(hass, call).values():
+            if coordinator.recorder is None:
+                raise HomeAssistantError(f"Recording is disabled for {coordinator.host}")
+            events = await hass.async_add_executor_job(coordinator.recorder.read, start, end)
+            if not events:
+                raise HomeAssistantError(f"Nothing was recorded for {coordinator.host} by then")
+            coordinator.replay.async_start(
+                events, start, call.data[ATTR_SPEED], call.data[ATTR_TARGET]
+            )
+
+    @callback
+    def async_stop_replay(call: ServiceCall) -> None:
+        """Stop replaying on the targeted panels, restoring them."""
+        for coordinator in _async_get_coordinators(hass, call).values():
+            coordinator.replay.async_stop()
+
+    async def async_profile_integration(call: ServiceCall) -> None:
+        """Profile the integration's code paths for a while."""
+        connections = hass.data.get(DOMAIN, {}).get(DATA_CONNECTIONS, {}).values()
+        try:
+            await async_profile(
+                hass, list(connections), call.data[ATTR_DURATION], call.data[ATTR_CLOCK]
+            )
+        except RuntimeError as ex:
+            raise HomeAssistantError(str(ex)) from ex
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_START_PLAYLIST, async_start_playlist, schema=START_PLAYLIST_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_STOP_PLAYLIST, async_stop_playlist, schema=DEVICE_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_SKIP_PLAYLIST, async_skip_playlist, schema=DEVICE_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_START_EFFECT, async_start_effect, schema=START_EFFECT_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_STOP_EFFECT, async_stop_effect, schema=DEVICE_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_SNAPSHOT, async_snapshot, schema=SNAPSHOT_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_RESTORE, async_restore, schema=SNAPSHOT_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_REPLAY, async_replay, schema=REPLAY_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_STOP_REPLAY, async_stop_replay, schema=DEVICE_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_PROFILE, async_profile_integration, schema=PROFILE_SCHEMA
+    )
@@ -0,0 +1,126 @@
+"""Snapshot and restore of panel state for temporary notifications."""
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+
+from homeassistant.core import callback
+
+from .const import MAX_SNAPSHOTS
+
+if TYPE_CHECKING:
+    from .coordinator import IkeaLedCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class PanelSnapshot:
+    """Plugin, brightness and rotation of a panel at one point in time."""
+
+    name: Optional[str]
+    plugin: Optional[int]
+    brightness: Optional[int]
+    rotation: Optional[int]
+
+
+class SnapshotStack:
+    """Stack of panel snapshots, so overlapping notifications restore correctly."""
+
+    def __init__(self, coordinator: IkeaLedCoordinator) -> None:
+        """Initialize the stack."""
+        self._coordinator = coordinator
+        self._stack: list[PanelSnapshot] = []
+
+    @callback
+    def async_snapshot(self, name: Optional[str] = None) -> PanelSnapshot:
+        """Push the panel's current state, read from the cached device state."""
+        snapshot = PanelSnapshot(
+            name,
+            self._coordinator.get_active_plugin(),
+            self._coordinator.get_brightness(),
+            self._coordinator.get_rotation(),
+        )
+        if len(self._stack) >= MAX_SNAPSHOTS:
+            _LOGGER.warning(
+                "Too many snapshots of %s; discarding the oldest", self._coordinator.host
+            )
+            del self._stack[0]
+        self._stack.append(snapshot)
+        return snapshot
+
+    @callback
+    def _async_take(self, name: Optional[str]) -> Optional[PanelSnapshot]:
+        """Find a snapshot; return it if the panel should go back to it.
+
+        Without a name the newest snapshot is taken. A named snapshot that is
+        not the newest was taken before a later notification, so its state is
+        handed to the snapshot above it, it is removed and nothing is restored
+        yet. The newest snapshot stays on the stack for the caller to remove.
+        """
+        if name is None:
+            index = len(self._stack) - 1
+        else:
+            index = next(
+                (i for i in reversed(range(len(self._stack))) if self._stack[i].name == name),
+                -1,
+            )
+        if index < 0:
+            raise KeyError(name)
+
+        if index < len(self._stack) - 1:
+            snapshot = self._stack.pop(index)
+            above = self._stack[index]
+            above.plugin = snapshot.plugin
+            above.brightness = snapshot.brightness
+            above.rotation = snapshot.rotation
+            return None
+        return self._stack[index]
+
+    @callback
+    def _async_remove(self, snapshot: PanelSnapshot) -> None:
+        """Remove this snapshot object, unless it was already discarded."""
+        # Compared by identity, as two snapshots can hold the same state
+        for index, candidate in enumerate(self._stack):
+            if candidate is snapshot:
+                del self._stack[index]
+                return
+
+    @callback
+    def async_discard(self, name: Optional[str] = None) -> None:
+        """Forget a snapshot without touching the panel."""
+        try:
+            snapshot = self._async_take(name)
+        except KeyError:
+            return
+        if snapshot is not None:
+            self._async_remove(snapshot)
+
+    async def async_restore(self, name: Optional[str] = None) -> None:
+        """Put the panel back as it was, sending only the fields that differ.
+
+        Raises KeyError if there is no matching snapshot.
+        """
+        snapshot = self._async_take(name)
+        if snapshot is None:
+            return
+
+        coordinator = self._coordinator
+        if snapshot.plugin != coordinator.get_active_plugin():
+            # An effect started for the notification would keep drawing otherwise
+            coordinator.effects.async_stop()
+        messages = coordinator.state_messages(
+            plugin=_changed(snapshot.plugin, coordinator.get_active_plugin()),
+            brightness=_changed(snapshot.brightness, coordinator.get_brightness()),
+            rotation=_changed(snapshot.rotation, coordinator.get_rotation()),
+        )
+        if messages:
+            # Left on the stack until sent, so a failed restore can be retried
+            await coordinator.async_send_commands(messages)
+        self._async_remove(snapshot)
+
+
+def _changed(saved: Optional[int], current: Optional[int]) -> Optional[int]:
+    """Return the saved value if it differs from the current one, else None."""
+    return saved if saved != current else None
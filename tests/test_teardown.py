@@ -0,0 +1,164 @@
+"""Reloading an entry must not leak threads, sockets or server connections."""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import inspect
+import json
+import os
+import threading
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import websockets
+from homeassistant import config_entries
+
+from custom_components.ikea_obegraensad import async_setup_entry, async_unload_entry
+from custom_components.ikea_obegraensad.const import DATA_CONNECTIONS, DOMAIN
+from custom_components.ikea_obegraensad.coordinator import IkeaLedCoordinator
+
+RELOADS = 100
+CONNECT_TIMEOUT = 5.0
+
+
+def open_fds() -> int:
+    """Return the number of file descriptors open in this process."""
+    return len(os.listdir("/proc/self/fd"))
+
+
+def make_hass(loop: asyncio.AbstractEventLoop, config_dir: Path) -> MagicMock:
+    """Return the parts of Home Assistant that entry setup and unload use."""
+    hass = MagicMock()
+    hass.loop = loop
+    hass.data = {}
+    hass.async_add_executor_job = lambda func, *args: loop.run_in_executor(None, func, *args)
+    hass.config.path = lambda *parts: str(config_dir.joinpath(*parts))
+    hass.config_entries.async_forward_entry_setups = AsyncMock()
+    hass.config_entries.async_unload_platforms = AsyncMock(return_value=True)
+    return hass
+
+
+def make_entry(host: str) -> MagicMock:
+    """Return a config entry for the stand-in panel that collects on-unload callbacks."""
+    entry = MagicMock()
+    entry.entry_id = "teardown"
+    entry.data = {"host": host}
+    entry.options = {}
+    entry.on_unload = []
+    entry.async_on_unload = entry.on_unload.append
+    return entry
+
+
+@contextlib.asynccontextmanager
+async def stand_in_panel() -> AsyncIterator[tuple[str, set]]:
+    """Serve a minimal panel on a free local port; yield its host and open clients."""
+    clients: set = set()
+
+    async def panel(websocket) -> None:
+        clients.add(websocket)
+        try:
+            await websocket.send(
+                json.dumps({"brightness": 10, "rotation": 1, "plugin": 2, "plugins": []})
+            )
+            async for _ in websocket:
+                pass
+        finally:
+            clients.discard(websocket)
+
+    async with websockets.serve(panel, "127.0.0.1", 0) as server:
+        yield f"127.0.0.1:{server.sockets[0].getsockname()[1]}", clients
+
+
+async def wait_connected(coordinator: IkeaLedCoordinator) -> None:
+    """Wait until the coordinator has the stand-in panel's state."""
+    async with asyncio.timeout(CONNECT_TIMEOUT):
+        while not (coordinator.ws_connected and coordinator.get_brightness() == 10):
+            await asyncio.sleep(0.01)
+
+
+async def setup_entry(hass: MagicMock, entry: MagicMock) -> IkeaLedCoordinator:
+    """Set the entry up the way Home Assistant does, with it as the current entry."""
+    token = config_entries.current_entry.set(entry)
+    try:
+        assert await async_setup_entry(hass, entry)
+    finally:
+        config_entries.current_entry.reset(token)
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    await wait_connected(coordinator)
+    return coordinator
+
+
+async def unload_entry(hass: MagicMock, entry: MagicMock) -> None:
+    """Unload the entry, then run its on-unload callbacks as Home Assistant does."""
+    assert await async_unload_entry(hass, entry)
+    while entry.on_unload:
+        if inspect.isawaitable(result := entry.on_unload.pop()()):
+            await result
+
+
+async def run_reloads(config_dir: Path) -> dict[str, tuple[int, int]]:
+    """Reload an entry against a local stand-in panel; return counts before and after."""
+    async with stand_in_panel() as (host, clients):
+        loop = asyncio.get_running_loop()
+        # One executor worker, so the pool growing is not mistaken for a leak
+        loop.set_default_executor(ThreadPoolExecutor(max_workers=1))
+        hass = make_hass(loop, config_dir)
+        entry = make_entry(host)
+        (config_dir / ".storage").mkdir()
+
+        # The first cycle starts the executor's worker thread
+        await setup_entry(hass, entry)
+        await unload_entry(hass, entry)
+        await asyncio.sleep(0.2)
+        threads, fds = threading.active_count(), open_fds()
+
+        for _ in range(RELOADS):
+            await setup_entry(hass, entry)
+            await unload_entry(hass, entry)
+        await asyncio.sleep(0.2)
+
+        return {
+            "threads": (threads, threading.active_count()),
+            "fds": (fds, open_fds()),
+            "clients": (0, len(clients)),
+        }
+
+
+def test_reload_does_not_leak(tmp_path: Path) -> None:
+    """Thread, file descriptor and server client counts stay flat across reloads."""
+    counts = asyncio.run(run_reloads(tmp_path))
+    for name, (before, after) in counts.items():
+        assert after == before, f"{name}: {before} before, {after} after {RELOADS} reloads"
+
+
+async def run_shared_unload(config_dir: Path) -> None:
+    """Unload an entry while another coordinator shares its connection."""
+    async with stand_in_panel() as (host, clients):
+        hass = make_hass(asyncio.get_running_loop(), config_dir)
+        entry = make_entry(host)
+        (config_dir / ".storage").mkdir()
+
+        await setup_entry(hass, entry)
+        # Like the config flow's connection test, on the same host
+        other = IkeaLedCoordinator(hass, host)
+        connection = other.connection
+        assert connection.refs == 2
+
+        await unload_entry(hass, entry)
+        assert connection.refs == 1
+        assert other.ws_connected
+        assert hass.data[DOMAIN][DATA_CONNECTIONS] == {host: connection}
+
+        await other.async_shutdown()
+        await other.async_shutdown()
+        assert connection.refs == 0
+        assert hass.data[DOMAIN][DATA_CONNECTIONS] == {}
+        await asyncio.sleep(0.2)
+        assert not clients
+
+
+def test_unload_releases_connection_once(tmp_path: Path) -> None:
+    """Shutting a coordinator down twice releases its share of the connection once."""
+    asyncio.run(run_shared_unload(tmp_path))